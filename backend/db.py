@@ -11,16 +11,66 @@ Date: 2024
 """
 
 import os
-from supabase import create_client, Client
-from typing import Optional
+from supabase import Client
+from supabase.lib.client_options import ClientOptions
+from postgrest import SyncPostgrestClient
+from postgrest.constants import DEFAULT_POSTGREST_CLIENT_TIMEOUT
+from postgrest.utils import SyncClient
+from typing import Optional, Union
+import httpx
 import logging
 from dotenv import load_dotenv
 
+from utils.config import settings
+from utils.retry import retry_db_operation
+
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# HTTP connection pool settings for PostgREST requests (pool sizes: settings)
+SUPABASE_KEEPALIVE_EXPIRY = 60
+SUPABASE_TRANSPORT_RETRIES = 3
+SUPABASE_REQUEST_TIMEOUT = 30
+
+class PooledPostgrestClient(SyncPostgrestClient):
+    """PostgREST client whose HTTP session uses an explicitly sized keep-alive pool"""
+    
+    def create_session(
+        self,
+        base_url: str,
+        headers: dict,
+        timeout: Union[int, float, httpx.Timeout],
+    ) -> SyncClient:
+        """Create the underlying HTTP session with pooled, retrying transport"""
+        limits = httpx.Limits(
+            max_connections=settings.SUPABASE_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.SUPABASE_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=SUPABASE_KEEPALIVE_EXPIRY
+        )
+        transport = httpx.HTTPTransport(retries=SUPABASE_TRANSPORT_RETRIES, limits=limits)
+        return SyncClient(
+            base_url=base_url,
+            headers=headers,
+            timeout=timeout,
+            transport=transport
+        )
+
+class PooledClient(Client):
+    """Supabase client that routes table/RPC calls through PooledPostgrestClient"""
+    
+    @staticmethod
+    def _init_postgrest_client(
+        rest_url: str,
+        headers: dict,
+        schema: str,
+        timeout: Union[int, float, httpx.Timeout] = DEFAULT_POSTGREST_CLIENT_TIMEOUT,
+    ) -> SyncPostgrestClient:
+        return PooledPostgrestClient(
+            rest_url, headers=headers, schema=schema, timeout=timeout
+        )
+
 class DatabaseConnection:
     """Database connection manager"""
     
@@ -49,11 +99,12 @@ class DatabaseConnection:
                     "SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY must be set in environment variables"
                 )
             
-            self._client = create_client(supabase_url, supabase_key)
+            options = ClientOptions(postgrest_client_timeout=SUPABASE_REQUEST_TIMEOUT)
+            self._client = PooledClient(supabase_url, supabase_key, options=options)
             logger.info("Supabase client initialized successfully")
             
         except Exception as e:
-            logger.error(f"Failed to initialize Supabase client: {str(e)}")
+            logger.error("Failed to initialize Supabase client: %s", e)
             raise
     
     def get_client(self) -> Client:
@@ -65,17 +116,40 @@ class DatabaseConnection:
     def test_connection(self) -> bool:
         """Test database connection"""
         try:
-            # Simple test query to verify connection
-            response = self._client.table('meetings').select('count', count='exact').execute()
+            # Cheap existence probe - avoids a full-table COUNT(*) on every call
+            response = retry_db_operation(
+                lambda: self._client.table('meetings').select('id').limit(1).execute(),
+                max_retries=2,
+                on_reconnect=self.force_reconnect
+            )
             return response.data is not None
         except Exception as e:
-            logger.error(f"Database connection test failed: {str(e)}")
+            logger.error("Database connection test failed: %s", e)
             return False
     
+    def force_reconnect(self) -> None:
+        """
+        Make the next query open a fresh HTTP connection pool
+        
+        The Supabase client object itself is kept, so services holding a
+        reference from get_db_client() pick up the new pool transparently.
+        The old pool is not closed: other request threads may still be using
+        it, and closing it would fail their queries. It is released once the
+        last query holding it finishes.
+        """
+        if not self._client:
+            self._initialize_client()
+            return
+        
+        self._client._postgrest = None
+        logger.info("Database connection pool reset")
+    
     def close_connection(self) -> None:
-        """Close database connection (if needed)"""
-        # Supabase client doesn't require explicit closing
-        # This method is included for consistency
+        """Close database connection and release pooled HTTP connections"""
+        postgrest = getattr(self._client, '_postgrest', None)
+        if postgrest is not None:
+            # Despite the name, SyncPostgrestClient.aclose() is a blocking httpx Client.close()
+            postgrest.aclose()
         logger.info("Database connection closed")
         self._client = None
 
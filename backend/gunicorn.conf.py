@@ -8,7 +8,11 @@ backlog = 2048
 
 # Worker processes
 workers = multiprocessing.cpu_count() * 2 + 1
-worker_class = "sync"
+# Threaded workers keep serving while a request waits on Supabase/Cloudinary/Make.com.
+# gevent is not used: monkey-patching conflicts with the background asyncio loop
+# thread and the Cloudinary thread pool.
+worker_class = "gthread"
+threads = int(os.environ.get('GUNICORN_THREADS', '4'))
 worker_connections = 1000
 timeout = 120
 keepalive = 2
@@ -37,8 +41,9 @@ tmp_upload_dir = None
 # keyfile = None
 # certfile = None
 
-# Preload app for better performance
-preload_app = True
+# Load the app in each worker: connection pools, the background event loop
+# and the startup warmup must not be shared across fork()
+preload_app = False
 
 # Worker timeout
 graceful_timeout = 30
@@ -11,13 +11,14 @@ Author: Your Name
 Date: 2024
 """
 
-from flask import Flask, request, jsonify, send_from_directory, send_file
+from flask import Flask, request, jsonify, send_from_directory, send_file, abort
 from flask_cors import CORS
 import os
 import logging
 from dotenv import load_dotenv
 import signal
 import sys
+import threading
 
 # Import business logic from utils
 
@@ -26,27 +27,75 @@ from utils.meeting_service import MeetingService
 from utils.meeting_processor_service import MeetingProcessorService
 
 from utils.database_service import DatabaseService
+from utils.health_service import HealthService
+from utils.background_loop import start_background_loop, run_async
+from utils.config import settings
+from utils.json_provider import OrjsonProvider
 
 # Load environment variables
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+def configure_logging():
+    """Install root log handlers (no-op if logging is already configured)"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+def conditional_response(result):
+    """
+    Add a weak ETag to a successful (response, status) result and answer
+    matching If-None-Match requests with 304 Not Modified
+    
+    Args:
+        result: (Response, status code) tuple from a service method
+        
+    Returns:
+        Response or the original tuple for non-200 results
+    """
+    response, status = result
+    if status != 200:
+        return result
+    
+    response.add_etag(weak=True)
+    return response.make_conditional(request)
+
+def page_params(default_limit: int):
+    """
+    Parse the limit and offset query parameters of a list endpoint
+    
+    Args:
+        default_limit: Limit to use when the parameter is absent
+        
+    Returns:
+        Tuple[int, int]: Clamped limit and offset
+        
+    Raises:
+        BadRequest: If limit or offset is not an integer (answered with 400)
+    """
+    try:
+        return (
+            settings.list_limit(request.args.get('limit'), default_limit),
+            settings.list_offset(request.args.get('offset'))
+        )
+    except ValueError:
+        abort(400, description='limit and offset must be integers')
+
 def create_app():
     """Application factory pattern"""
+    configure_logging()
+    
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     
     # Security and middleware setup
-    app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'your-secret-key-change-this')
-    app.config['MAX_CONTENT_LENGTH'] = 500 * 1024 * 1024  # 500MB max file size
+    app.config['SECRET_KEY'] = settings.SECRET_KEY
+    app.config['MAX_CONTENT_LENGTH'] = settings.MAX_CONTENT_LENGTH
     
     # Enable CORS
-    CORS(app, origins=os.getenv('ALLOWED_ORIGINS', '*').split(','))
+    CORS(app, origins=list(settings.ALLOWED_ORIGINS))
     
     # Initialize services
     
@@ -56,23 +105,38 @@ def create_app():
 
     db_service = DatabaseService()
     
+    # Long-lived event loop shared by all requests that run coroutines
+    start_background_loop()
+    
+    health_service = HealthService(db_service)
+    
+    # Populate DB/Cloudinary connections without blocking startup
+    threading.Thread(target=health_service.warm_up, name='warmup', daemon=True).start()
+    
     # Health check endpoint
     @app.route('/health', methods=['GET'])
     def health_check():
         """Health check endpoint"""
         try:
-            # Test database connection
-            db_healthy = db_service.test_connection()
+            # Probe all dependencies concurrently (cached for a few seconds)
+            checks = health_service.check()
+            db_healthy = checks.get('database', False)
+            # Skipped probes (None) don't degrade the status
+            all_healthy = all(result is not False for result in checks.values())
+            cloudinary_healthy = checks.get('cloudinary')
+            cloudinary_status = 'skipped' if cloudinary_healthy is None \
+                else 'connected' if cloudinary_healthy else 'disconnected'
             
             return jsonify({
-                'status': 'healthy' if db_healthy else 'degraded',
+                'status': 'healthy' if all_healthy else 'degraded',
                 'database': 'connected' if db_healthy else 'disconnected',
+                'cloudinary': cloudinary_status,
                 'timestamp': '2024-01-01T00:00:00Z',
                 'version': '1.0.0'
             }), 200 if db_healthy else 503
             
         except Exception as e:
-            logger.error(f"Health check failed: {str(e)}")
+            logger.error("Health check failed: %s", e)
             return jsonify({
                 'status': 'unhealthy',
                 'error': str(e),
@@ -94,8 +158,14 @@ def create_app():
             "organization_id": "uuid"
         }
         
+        or, to process several meetings at once:
+        {
+            "meeting_ids": ["uuid", ...],
+            "organization_id": "uuid"
+        }
+        
         Returns:
-        - 200: Processing started successfully
+        - 200: Processing started successfully (batch: for at least one meeting; see "errors")
         - 400: Invalid request or meeting ID
         - 404: Meeting not found in Supabase
         - 500: Server error
@@ -106,26 +176,29 @@ def create_app():
                 return jsonify({'error': 'No data provided'}), 400
             
             meeting_id = data.get('meeting_id')
+            meeting_ids = data.get('meeting_ids')
             organization_id = data.get('organization_id')
             
+            if meeting_ids is not None:
+                if not isinstance(meeting_ids, list) or not meeting_ids or not organization_id:
+                    return jsonify({'error': 'meeting_ids (non-empty list) and organization_id are required'}), 400
+                
+                result, status_code = run_async(
+                    meeting_processor_service.process_meeting_ids(meeting_ids, organization_id)
+                )
+                return jsonify(result), status_code
+            
             if not meeting_id or not organization_id:
                 return jsonify({'error': 'meeting_id and organization_id are required'}), 400
             
-            # Process the meeting ID asynchronously
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            # Process the meeting ID on the shared background loop
+            result, status_code = run_async(
+                meeting_processor_service.process_meeting_id(meeting_id, organization_id)
+            )
+            return jsonify(result), status_code
             
-            try:
-                result, status_code = loop.run_until_complete(
-                    meeting_processor_service.process_meeting_id(meeting_id, organization_id)
-                )
-                return jsonify(result), status_code
-            finally:
-                loop.close()
-                
         except Exception as e:
-            logger.error(f"Error processing meeting: {str(e)}")
+            logger.error("Error processing meeting: %s", e)
             return jsonify({'error': 'Internal server error'}), 500
     
     @app.route('/api/upload/status/<meeting_id>', methods=['GET'])
@@ -159,6 +232,7 @@ def create_app():
         
         Returns:
         - 200: Webhook processed successfully
+        - 202: Webhook accepted for background processing (WEBHOOK_ASYNC_ENABLED)
         - 400: Invalid payload
         - 500: Server error
         """
@@ -191,6 +265,7 @@ def create_app():
         
         Returns:
         - 200: Webhook processed successfully
+        - 202: Webhook accepted for background processing (WEBHOOK_ASYNC_ENABLED)
         - 400: Invalid payload
         - 500: Server error
         """
@@ -204,18 +279,20 @@ def create_app():
         
         Query parameters:
         - organization_id: Filter by organization (optional)
-        - limit: Number of records to return (default: 10)
+        - limit: Number of records to return (default: 10, max: MAX_LIST_LIMIT)
         - offset: Number of records to skip (default: 0)
+        - cursor: next_cursor from the previous page (optional, preferred over offset)
         
         Returns:
         - 200: List of meetings
+        - 400: Invalid limit, offset or cursor
         - 500: Server error
         """
         organization_id = request.args.get('organization_id')
-        limit = int(request.args.get('limit', 10))
-        offset = int(request.args.get('offset', 0))
+        limit, offset = page_params(settings.DEFAULT_LIST_LIMIT)
+        cursor = request.args.get('cursor')
         
-        return meeting_service.get_meetings(organization_id, limit, offset)
+        return meeting_service.get_meetings(organization_id, limit, offset, cursor)
     
     @app.route('/api/meetings/transcribed', methods=['GET'])
     def get_meetings_with_transcripts():
@@ -224,16 +301,16 @@ def create_app():
 
         Query parameters:
         - organization_id: Filter by organization (optional)
-        - limit: Number of records to return (default: 100)
+        - limit: Number of records to return (default: 100, max: MAX_LIST_LIMIT)
         - offset: Number of records to skip (default: 0)
 
         Returns:
-        - 200: List of meetings with completed transcripts
+        - 200: List of meetings with completed transcripts (transcript preview and length only)
+        - 400: Invalid limit or offset
         - 500: Server error
         """
         organization_id = request.args.get('organization_id')
-        limit = int(request.args.get('limit', 100))
-        offset = int(request.args.get('offset', 0))
+        limit, offset = page_params(settings.DEFAULT_OPTIONS_LIMIT)
         return meeting_service.get_meetings_with_transcripts(organization_id, limit, offset)
 
     @app.route('/api/meetings/transcribed/options', methods=['GET'])
@@ -243,17 +320,18 @@ def create_app():
 
         Query parameters:
         - organization_id: Filter by organization (optional)
-        - limit: Number of records to return (default: 100)
+        - limit: Number of records to return (default: 100, max: MAX_LIST_LIMIT)
         - offset: Number of records to skip (default: 0)
 
         Returns:
-        - 200: Options list
+        - 200: Options list (with ETag)
+        - 304: Options unchanged since the If-None-Match ETag
+        - 400: Invalid limit or offset
         - 500: Server error
         """
         organization_id = request.args.get('organization_id')
-        limit = int(request.args.get('limit', 100))
-        offset = int(request.args.get('offset', 0))
-        return meeting_service.get_transcribed_meeting_options(organization_id, limit, offset)
+        limit, offset = page_params(settings.DEFAULT_OPTIONS_LIMIT)
+        return conditional_response(meeting_service.get_transcribed_meeting_options(organization_id, limit, offset))
 
     @app.route('/api/organizations/options', methods=['GET'])
     def get_organization_options():
@@ -261,10 +339,11 @@ def create_app():
         Get compact organization options for dropdowns: [{ value, label }]
 
         Returns:
-        - 200: Organization options list
+        - 200: Organization options list (with ETag)
+        - 304: Options unchanged since the If-None-Match ETag
         - 500: Server error
         """
-        return meeting_service.get_organization_options()
+        return conditional_response(meeting_service.get_organization_options())
 
     @app.route('/api/meetings/<meeting_id>', methods=['GET'])
     def get_meeting(meeting_id):
@@ -281,6 +360,21 @@ def create_app():
         """
         return meeting_service.get_meeting(meeting_id)
     
+    @app.route('/api/meetings/<meeting_id>/transcript', methods=['GET'])
+    def get_meeting_transcript(meeting_id):
+        """
+        Get the full transcript of a meeting
+        
+        Args:
+        - meeting_id: UUID of the meeting
+        
+        Returns:
+        - 200: Transcript and summary
+        - 404: No transcript for this meeting
+        - 500: Server error
+        """
+        return meeting_service.get_meeting_transcript(meeting_id)
+    
 
     
 
@@ -297,6 +391,10 @@ def create_app():
         return send_from_directory('../frontend', 'dashboard.html')
     
     # Error Handlers
+    @app.errorhandler(400)
+    def bad_request(e):
+        return jsonify({'error': e.description}), 400
+    
     @app.errorhandler(413)
     def too_large(e):
         return jsonify({'error': 'File too large'}), 413
@@ -307,7 +405,7 @@ def create_app():
     
     @app.errorhandler(500)
     def internal_error(e):
-        logger.error(f"Internal server error: {str(e)}")
+        logger.error("Internal server error: %s", e)
         return jsonify({'error': 'Internal server error'}), 500
     
     return app
@@ -318,6 +416,21 @@ def signal_handler(sig, frame):
     sys.exit(0)
 
 if __name__ == '__main__':
+    # Get port from environment or default to 3000
+    port = settings.PORT
+    
+    # The Werkzeug server (and debug=True) is for local development only;
+    # anywhere else hand the process over to gunicorn
+    if not settings.DEBUG:
+        configure_logging()
+        logger.info("Starting gunicorn on port %s", port)
+        os.execvp('gunicorn', [
+            'gunicorn',
+            '-c', 'gunicorn.conf.py',
+            '-b', f'0.0.0.0:{port}',
+            'wsgi:application'
+        ])
+    
     # Register signal handlers
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
@@ -325,15 +438,12 @@ if __name__ == '__main__':
     # Create and run the application
     app = create_app()
     
-    # Get port from environment or default to 3000
-    port = int(os.getenv('PORT', 3000))
-    
-    logger.info(f"Starting Flask application on port {port}")
+    logger.info("Starting Flask development server on port %s", port)
     logger.info("Press Ctrl+C to stop the server")
     
     # Run the application
     app.run(
         host='0.0.0.0',
         port=port,
-        debug=os.getenv('FLASK_ENV') == 'development'
-    ) 
\ No newline at end of file
+        debug=True
+    )
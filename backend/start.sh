@@ -15,8 +15,8 @@ export PORT=${PORT:-10000}
 # Check if we should use gunicorn config file
 if [ -f "gunicorn.conf.py" ]; then
     echo "Using gunicorn configuration file..."
-    gunicorn main:create_app() -c gunicorn.conf.py
+    gunicorn -c gunicorn.conf.py wsgi:application
 else
     echo "Using default gunicorn settings..."
-    gunicorn main:create_app() --bind 0.0.0.0:$PORT --workers 2 --timeout 120
+    gunicorn wsgi:application --bind 0.0.0.0:$PORT --workers 2 --threads 4 --worker-class gthread --timeout 120
 fi
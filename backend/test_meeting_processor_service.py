@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Tests for the content generation webhook circuit breaker
+
+Runs without network access or credentials:
+
+    python -m unittest test_meeting_processor_service
+"""
+
+import asyncio
+import unittest
+from unittest import mock
+
+from utils import meeting_processor_service
+from utils.meeting_processor_service import MeetingProcessorService, WEBHOOK_BREAKER_COOLDOWN
+
+
+class FakeSession:
+    """Stand-in for the shared aiohttp session whose POST raises a given error"""
+
+    def __init__(self, error):
+        self.error = error
+
+    def post(self, *args, **kwargs):
+        raise self.error
+
+
+class WebhookBreakerTest(unittest.TestCase):
+    """MeetingProcessorService._post_webhook_with_retry and its circuit breaker"""
+
+    def setUp(self):
+        patcher = mock.patch.object(meeting_processor_service, 'get_db_client')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.service = MeetingProcessorService()
+        self.breaker = self.service._webhook_breaker
+        self.now = 1000.0
+        clock = mock.patch('utils.retry.time.monotonic', side_effect=lambda: self.now)
+        clock.start()
+        self.addCleanup(clock.stop)
+
+    def post(self, error):
+        with mock.patch.object(meeting_processor_service, 'get_http_session', return_value=FakeSession(error)):
+            return asyncio.run(self.service._post_webhook_with_retry('https://hook.example/test', b'{}'))
+
+    def open_breaker(self):
+        for _ in range(self.breaker.failure_threshold):
+            self.breaker.record_failure()
+        self.assertFalse(self.breaker.allow())
+        self.now += WEBHOOK_BREAKER_COOLDOWN
+
+    def test_cancelled_trial_reopens_breaker(self):
+        self.open_breaker()
+
+        with self.assertRaises(asyncio.CancelledError):
+            self.post(asyncio.CancelledError())
+
+        self.assertFalse(self.breaker.allow())
+        self.now += WEBHOOK_BREAKER_COOLDOWN
+        self.assertTrue(self.breaker.allow())
+
+    def test_unexpected_error_in_trial_reopens_breaker(self):
+        self.open_breaker()
+
+        with self.assertRaises(RuntimeError):
+            self.post(RuntimeError('Session is closed'))
+
+        self.now += WEBHOOK_BREAKER_COOLDOWN
+        self.assertTrue(self.breaker.allow())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Tests for MeetingService pagination
+
+Runs against an in-memory stand-in for the Supabase query builder, so no
+database or credentials are needed:
+
+    python -m unittest test_meeting_service
+"""
+
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from flask import Flask
+
+from utils.meeting_service import MeetingService, decode_cursor
+
+
+class FakeParams:
+    """Stand-in for the query builder's immutable params"""
+
+    def add(self, key, value):
+        return self
+
+
+class FakeQuery:
+    """Minimal meetings query builder that slices a fixed list of rows"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.params = FakeParams()
+        self.limit_size = None
+        self.offset_size = 0
+        self.requested_limits = []
+
+    def select(self, *args, **kwargs):
+        return self
+
+    def eq(self, *args):
+        return self
+
+    def limit(self, size):
+        self.limit_size = size
+        self.requested_limits.append(size)
+        return self
+
+    def offset(self, size):
+        self.offset_size = size
+        return self
+
+    def execute(self):
+        end = None if self.limit_size is None else self.offset_size + self.limit_size
+        return SimpleNamespace(data=self.rows[self.offset_size:end], count=len(self.rows))
+
+
+def make_meetings(count):
+    """Build meeting rows ordered newest first"""
+    return [
+        {'id': f'00000000-0000-0000-0000-{i:012d}', 'created_at': f'2024-01-01T00:00:{59 - i:02d}+00:00'}
+        for i in range(count)
+    ]
+
+
+class GetMeetingsPaginationTest(unittest.TestCase):
+    """Offset and cursor pages of MeetingService.get_meetings"""
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.query = None
+        self.db_client = mock.Mock()
+        self.db_client.table.side_effect = lambda name: self.query
+        patcher = mock.patch('utils.meeting_service.get_db_client', return_value=self.db_client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.service = MeetingService()
+
+    def get_page(self, rows, limit, offset=0, cursor=None):
+        self.query = FakeQuery(rows)
+        with self.app.app_context():
+            response, status = self.service.get_meetings('org-1', limit, offset, cursor)
+            return response.get_json(), status
+
+    def test_full_first_page_yields_cursor(self):
+        rows = make_meetings(5)
+        body, status = self.get_page(rows, limit=2)
+
+        self.assertEqual(status, 200)
+        self.assertEqual(body['meetings'], rows[:2])
+        self.assertIsNotNone(body['next_cursor'])
+        self.assertEqual(decode_cursor(body['next_cursor']), (rows[1]['created_at'], rows[1]['id']))
+
+    def test_single_row_page_yields_cursor(self):
+        rows = make_meetings(3)
+        body, _ = self.get_page(rows, limit=1)
+
+        self.assertEqual(body['meetings'], rows[:1])
+        self.assertIsNotNone(body['next_cursor'])
+
+    def test_last_page_has_no_cursor(self):
+        rows = make_meetings(2)
+        body, _ = self.get_page(rows, limit=2)
+
+        self.assertEqual(body['meetings'], rows)
+        self.assertIsNone(body['next_cursor'])
+
+    def test_invalid_cursor_is_rejected(self):
+        body, status = self.get_page(make_meetings(1), limit=2, cursor='not-a-cursor')
+
+        self.assertEqual(status, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
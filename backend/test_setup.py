@@ -6,6 +6,8 @@ Run this to check if everything is configured correctly.
 
 import os
 import sys
+import asyncio
+from typing import List, Tuple
 from dotenv import load_dotenv
 
 # Add the backend directory to the path
@@ -14,7 +16,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 # Load environment variables
 load_dotenv()
 
-def test_environment():
+def test_environment() -> Tuple[bool, List[str]]:
     """Test if environment variables are set"""
     required_vars = [
         'SUPABASE_URL',
@@ -30,31 +32,24 @@ def test_environment():
             missing_vars.append(var)
     
     if missing_vars:
-        print("❌ Missing environment variables:")
-        for var in missing_vars:
-            print(f"   - {var}")
-        return False
+        return False, ["❌ Missing environment variables:"] + [f"   - {var}" for var in missing_vars]
     else:
-        print("✅ All required environment variables are set")
-        return True
+        return True, ["✅ All required environment variables are set"]
 
-def test_database_connection():
+def test_database_connection() -> Tuple[bool, List[str]]:
     """Test database connection"""
     try:
         from db import get_db_client, test_db_connection
         
         client = get_db_client()
         if test_db_connection():
-            print("✅ Database connection successful")
-            return True
+            return True, ["✅ Database connection successful"]
         else:
-            print("❌ Database connection failed")
-            return False
+            return False, ["❌ Database connection failed"]
     except Exception as e:
-        print(f"❌ Database connection error: {str(e)}")
-        return False
+        return False, [f"❌ Database connection error: {str(e)}"]
 
-def test_imports():
+def test_imports() -> Tuple[bool, List[str]]:
     """Test if all modules can be imported"""
     try:
         
@@ -65,11 +60,13 @@ def test_imports():
         from utils.validation_service import ValidationService
         
         
-        print("✅ All utility modules imported successfully")
-        return True
+        return True, ["✅ All utility modules imported successfully"]
     except Exception as e:
-        print(f"❌ Import error: {str(e)}")
-        return False
+        return False, [f"❌ Import error: {str(e)}"]
+
+async def run_tests(tests):
+    """Run all checks concurrently; results keep the order of `tests`"""
+    return await asyncio.gather(*(asyncio.to_thread(test_func) for _, test_func in tests))
 
 def main():
     print("🔍 Testing Backend Setup")
@@ -84,10 +81,15 @@ def main():
     passed = 0
     total = len(tests)
     
-    for test_name, test_func in tests:
+    # Checks are independent, so total time is the slowest check, not the sum
+    results = asyncio.run(run_tests(tests))
+    
+    for (test_name, _), (ok, messages) in zip(tests, results):
         print(f"\n🔍 Testing: {test_name}")
         print("-" * 30)
-        if test_func():
+        for message in messages:
+            print(message)
+        if ok:
             passed += 1
             print(f"✅ {test_name} - PASSED")
         else:
@@ -12,6 +12,12 @@ Modules:
 - database_service: Database operations and queries
 
 - validation_service: Input validation and sanitization
+- background_loop: Shared asyncio event loop for Flask request handlers
+- retry: Retry with backoff for transient database errors
+- health_service: Concurrent dependency health checks
+- meeting_loader: Batches concurrent meeting lookups into one query
+- config: Environment settings parsed once at startup
+- json_provider: orjson-backed JSON provider for Flask
 
 Author: Your Name
 Date: 2024
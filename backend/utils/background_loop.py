@@ -0,0 +1,107 @@
+"""
+Background Event Loop for Blog Automation System
+
+This module owns the single long-lived asyncio event loop used by the
+Flask application to run coroutines from synchronous request handlers:
+- Starting the loop in a dedicated daemon thread
+- Dispatching coroutines onto the loop and waiting for their result
+- Stopping the loop on shutdown
+
+The loop is bound to the process that started it. When a worker is forked
+(e.g. gunicorn with preload_app), the loop is transparently restarted in
+the child on first use.
+
+If uvloop is installed (Linux/macOS), it is used as the loop
+implementation; otherwise the standard asyncio loop is used.
+
+Author: Your Name
+Date: 2024
+"""
+
+import asyncio
+import atexit
+import logging
+import os
+import threading
+from typing import Any, Awaitable, Optional
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+logger = logging.getLogger(__name__)
+
+BACKGROUND_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: Optional[threading.Thread] = None
+_loop_pid: Optional[int] = None
+_lock = threading.Lock()
+
+
+def start_background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Start the background event loop if it is not already running
+
+    Returns:
+        asyncio.AbstractEventLoop: The running background loop
+    """
+    global BACKGROUND_LOOP, _loop_thread, _loop_pid
+
+    with _lock:
+        if (BACKGROUND_LOOP is not None and _loop_pid == os.getpid()
+                and _loop_thread is not None and _loop_thread.is_alive()):
+            return BACKGROUND_LOOP
+
+        # Only this loop uses uvloop; the global event loop policy is left alone
+        loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+        thread = threading.Thread(
+            target=loop.run_forever,
+            name='background-event-loop',
+            daemon=True
+        )
+        thread.start()
+
+        BACKGROUND_LOOP = loop
+        _loop_thread = thread
+        _loop_pid = os.getpid()
+        logger.info("Background event loop started (%s)", type(loop).__module__)
+        return loop
+
+
+def run_async(coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+    """
+    Run a coroutine on the background loop and wait for its result
+
+    Args:
+        coro: Coroutine to execute
+        timeout: Maximum number of seconds to wait (optional)
+
+    Returns:
+        Any: The coroutine's return value
+    """
+    loop = start_background_loop()
+    return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout)
+
+
+def stop_background_loop() -> None:
+    """Stop the background event loop and wait for its thread to exit"""
+    global BACKGROUND_LOOP, _loop_thread, _loop_pid
+
+    with _lock:
+        loop, thread = BACKGROUND_LOOP, _loop_thread
+        if loop is None or _loop_pid != os.getpid():
+            return
+
+        BACKGROUND_LOOP = None
+        _loop_thread = None
+        _loop_pid = None
+
+    loop.call_soon_threadsafe(loop.stop)
+    if thread is not None:
+        thread.join(timeout=5)
+    if not loop.is_running():
+        loop.close()
+    logger.info("Background event loop stopped")
+
+
+atexit.register(stop_background_loop)
@@ -21,7 +21,7 @@ Date: 2024
 
 import os
 import logging
-from typing import Dict, Any, Optional
+from typing import Optional
 import cloudinary
 import cloudinary.uploader
 import cloudinary.api
@@ -31,21 +31,65 @@ logger = logging.getLogger(__name__)
 class CloudinaryService:
     """Service class for Cloudinary operations"""
     
+    _instance: Optional['CloudinaryService'] = None
+    _configured: bool = False
+    cloud_name: Optional[str] = None
+    api_key: Optional[str] = None
+    api_secret: Optional[str] = None
+    
+    def __new__(cls):
+        """Singleton pattern to configure the global Cloudinary SDK only once"""
+        if cls._instance is None:
+            cls._instance = super(CloudinaryService, cls).__new__(cls)
+        return cls._instance
+    
     def __init__(self):
         """Initialize Cloudinary service with credentials"""
+        if self._configured:
+            return
+        
         try:
+            cls = type(self)
+            cls.cloud_name = os.getenv('CLOUDINARY_CLOUD_NAME')
+            cls.api_key = os.getenv('CLOUDINARY_API_KEY')
+            cls.api_secret = os.getenv('CLOUDINARY_API_SECRET')
             cloudinary.config(
-                cloud_name=os.getenv('CLOUDINARY_CLOUD_NAME'),
-                api_key=os.getenv('CLOUDINARY_API_KEY'),
-                api_secret=os.getenv('CLOUDINARY_API_SECRET')
+                cloud_name=cls.cloud_name,
+                api_key=cls.api_key,
+                api_secret=cls.api_secret
             )
+            cls._configured = True
             logger.info("Cloudinary service initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize Cloudinary service: {str(e)}")
+            logger.error("Failed to initialize Cloudinary service: %s", e)
             raise
     
-
+    @classmethod
+    def reset(cls) -> None:
+        """Forget the singleton so the next instantiation re-reads credentials (for tests)"""
+        cls._instance = None
+        cls._configured = False
+        cls.cloud_name = None
+        cls.api_key = None
+        cls.api_secret = None
     
-
+    def has_credentials(self) -> bool:
+        """Check whether all Cloudinary credentials are configured"""
+        return bool(self.cloud_name and self.api_key and self.api_secret)
     
- 
\ No newline at end of file
+    def ping(self) -> bool:
+        """
+        Check that the Cloudinary API is reachable with the configured credentials
+        
+        Returns:
+            bool: True if Cloudinary responded, False otherwise
+        """
+        try:
+            cloudinary.api.ping()
+            return True
+        except Exception as e:
+            logger.error("Cloudinary ping failed: %s", e)
+            return False
+
+# Global Cloudinary service instance
+cloudinary_service = CloudinaryService()
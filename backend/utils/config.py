@@ -0,0 +1,145 @@
+"""
+Application Settings for Blog Automation System
+
+This module reads environment configuration once at import including:
+- Flask secret key, port and debug mode
+- CORS allowed origins
+- Request size limit
+- Default and maximum page sizes for list endpoints
+- Connection pool sizes, concurrency limits and cache TTLs
+- Optional feature switches (webhook queue, meeting loader, options view)
+
+Routes and services read attributes from the shared `settings` instance
+instead of calling os.getenv and int() on every request.
+
+Author: Your Name
+Date: 2024
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Tuple
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+def _env_flag(name: str) -> bool:
+    """Read a true/false environment variable (default false)"""
+    return os.getenv(name, 'false').lower() == 'true'
+
+@dataclass(frozen=True)
+class Settings:
+    """Immutable application settings"""
+
+    SECRET_KEY: str
+    ALLOWED_ORIGINS: Tuple[str, ...]
+    MAX_CONTENT_LENGTH: int
+    PORT: int
+    DEBUG: bool
+    DEFAULT_LIST_LIMIT: int
+    DEFAULT_OPTIONS_LIMIT: int
+    MAX_LIST_LIMIT: int
+
+    # HTTP connection pool for PostgREST requests (per worker)
+    SUPABASE_MAX_CONNECTIONS: int
+    SUPABASE_MAX_KEEPALIVE_CONNECTIONS: int
+    # Keep-alive connection pool for outbound aiohttp requests (Supabase REST and Make.com)
+    HTTP_POOL_SIZE: int
+    # Maximum number of content generation webhooks in flight at once (per worker)
+    WEBHOOK_CONCURRENCY: int
+    # Threads for loading a meeting's related records in parallel
+    RELATED_QUERY_WORKERS: int
+
+    # Cache TTLs in seconds (0 disables where noted). Caches are per process,
+    # so writes made by other workers are only seen after they expire.
+    DB_CACHE_TTL: int  # DatabaseService reads (0 disables)
+    MEETINGS_COUNT_CACHE_TTL: int  # Per-organization meeting counts (0 disables)
+    SUPABASE_MEETING_CACHE_TTL: int  # Fetched meetings with a transcript
+    HEALTH_CACHE_TTL: float  # Last health check result
+
+    # Seconds each health probe may take before the dependency is reported as down
+    HEALTH_PROBE_TIMEOUT: float
+
+    # Acknowledge valid webhooks with 202 and process them on a background thread.
+    # The queue is in memory: events still queued when a worker exits are lost and
+    # Make.com will not resend them, so keep this off unless that is acceptable.
+    WEBHOOK_ASYNC_ENABLED: bool
+    # Webhooks waiting per worker; when full, webhooks are processed in the request
+    WEBHOOK_QUEUE_SIZE: int
+    # Route MeetingService lookups through the batching loader (adds up to one batch window of latency)
+    MEETING_LOADER_ENABLED: bool
+    # Read dropdown options from the transcribed_meeting_options materialized view
+    # (scripts/add-transcribed-meeting-options-view.sql); it may lag new transcripts by up to a minute
+    TRANSCRIBED_OPTIONS_VIEW_ENABLED: bool
+
+    @classmethod
+    def from_env(cls) -> 'Settings':
+        """
+        Build settings from environment variables
+
+        Returns:
+            Settings: Parsed settings
+        """
+        return cls(
+            SECRET_KEY=os.getenv('SECRET_KEY', 'your-secret-key-change-this'),
+            ALLOWED_ORIGINS=tuple(
+                origin.strip() for origin in os.getenv('ALLOWED_ORIGINS', '*').split(',') if origin.strip()
+            ),
+            MAX_CONTENT_LENGTH=int(os.getenv('MAX_FILE_SIZE', 500 * 1024 * 1024)),  # 500MB max file size
+            PORT=int(os.getenv('PORT', 3000)),
+            DEBUG=os.getenv('FLASK_ENV') == 'development',
+            DEFAULT_LIST_LIMIT=int(os.getenv('DEFAULT_LIST_LIMIT', 10)),
+            DEFAULT_OPTIONS_LIMIT=int(os.getenv('DEFAULT_OPTIONS_LIMIT', 100)),
+            MAX_LIST_LIMIT=int(os.getenv('MAX_LIST_LIMIT', 500)),
+            SUPABASE_MAX_CONNECTIONS=int(os.getenv('SUPABASE_MAX_CONNECTIONS', 60)),
+            SUPABASE_MAX_KEEPALIVE_CONNECTIONS=int(os.getenv('SUPABASE_MAX_KEEPALIVE_CONNECTIONS', 40)),
+            HTTP_POOL_SIZE=int(os.getenv('HTTP_POOL_SIZE', 50)),
+            WEBHOOK_CONCURRENCY=int(os.getenv('WEBHOOK_CONCURRENCY', 32)),
+            RELATED_QUERY_WORKERS=int(os.getenv('RELATED_QUERY_WORKERS', 8)),
+            DB_CACHE_TTL=int(os.getenv('DB_CACHE_TTL', 30)),
+            MEETINGS_COUNT_CACHE_TTL=int(os.getenv('MEETINGS_COUNT_CACHE_TTL', 30)),
+            SUPABASE_MEETING_CACHE_TTL=int(os.getenv('SUPABASE_MEETING_CACHE_TTL', 300)),
+            HEALTH_CACHE_TTL=float(os.getenv('HEALTH_CACHE_TTL', 5)),
+            HEALTH_PROBE_TIMEOUT=float(os.getenv('HEALTH_PROBE_TIMEOUT', 2)),
+            WEBHOOK_ASYNC_ENABLED=_env_flag('WEBHOOK_ASYNC_ENABLED'),
+            WEBHOOK_QUEUE_SIZE=int(os.getenv('WEBHOOK_QUEUE_SIZE', 1000)),
+            MEETING_LOADER_ENABLED=_env_flag('MEETING_LOADER_ENABLED'),
+            TRANSCRIBED_OPTIONS_VIEW_ENABLED=_env_flag('TRANSCRIBED_OPTIONS_VIEW_ENABLED')
+        )
+
+    def list_limit(self, value, default: int) -> int:
+        """
+        Parse a `limit` query parameter and clamp it to [1, MAX_LIST_LIMIT]
+
+        Args:
+            value: Raw query parameter value (None if absent)
+            default: Limit to use when the parameter is absent
+
+        Returns:
+            int: Page size to query
+
+        Raises:
+            ValueError: If the value is not an integer
+        """
+        limit = default if value is None else int(value)
+        return max(1, min(limit, self.MAX_LIST_LIMIT))
+
+    @staticmethod
+    def list_offset(value) -> int:
+        """
+        Parse an `offset` query parameter, clamping negative values to 0
+
+        Args:
+            value: Raw query parameter value (None if absent)
+
+        Returns:
+            int: Number of records to skip
+
+        Raises:
+            ValueError: If the value is not an integer
+        """
+        return 0 if value is None else max(0, int(value))
+
+# Global settings instance
+settings = Settings.from_env()
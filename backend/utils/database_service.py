@@ -5,6 +5,7 @@ This module handles all database operations and queries including:
 - Database connection testing
 - Common database operations
 - Query building and execution
+- Short-lived caching of reads (invalidated per table on writes)
 - Error handling
 
 Input Types:
@@ -25,18 +26,87 @@ Date: 2024
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+import threading
+from collections import defaultdict
+from typing import Dict, Any, List, Optional, Tuple
 
-from db import get_db_client
+from cachetools import TTLCache
+
+from db import get_db_client, db_connection
+from utils.config import settings
+from utils.retry import retry_db_operation
 
 logger = logging.getLogger(__name__)
 
+# Cached reads per process (TTL: settings.DB_CACHE_TTL)
+DB_CACHE_SIZE = 10_000
+
+# Count strategies supported by PostgREST
+COUNT_MODES = ('exact', 'planned', 'estimated')
+
+# Marker for "not in cache" (None and [] are valid cached results)
+_MISSING = object()
+
 class DatabaseService:
     """Service class for database operations"""
     
     def __init__(self):
         """Initialize database service"""
         self.db_client = get_db_client()
+        self._cache = TTLCache(maxsize=DB_CACHE_SIZE, ttl=settings.DB_CACHE_TTL) \
+            if settings.DB_CACHE_TTL > 0 else None
+        self._cache_lock = threading.Lock()
+        # Bumped on every write; part of each cache key so old entries are never read again
+        self._table_versions: Dict[str, int] = defaultdict(int)
+    
+    def _cache_key(self, table_name: str, *parts: Any) -> Tuple[Any, ...]:
+        """Build a cache key tied to the table's current version"""
+        with self._cache_lock:
+            return (table_name, self._table_versions[table_name]) + parts
+    
+    def _cache_get(self, key: Tuple[Any, ...]) -> Any:
+        """Get a cached value or _MISSING"""
+        if self._cache is None:
+            return _MISSING
+        with self._cache_lock:
+            return self._cache.get(key, _MISSING)
+    
+    def _cache_set(self, key: Tuple[Any, ...], value: Any) -> None:
+        """Store a value in the cache"""
+        if self._cache is None:
+            return
+        with self._cache_lock:
+            self._cache[key] = value
+    
+    def _invalidate(self, table_name: str) -> None:
+        """Invalidate all cached reads for a table"""
+        with self._cache_lock:
+            self._table_versions[table_name] += 1
+    
+    @staticmethod
+    def _freeze_filters(filters: Optional[Dict[str, Any]]) -> Tuple[Tuple[str, str], ...]:
+        """Turn filter conditions into a hashable, order-independent key part"""
+        return tuple(sorted((key, repr(value)) for key, value in (filters or {}).items()))
+    
+    def _execute(self, run_query, max_retries: int = 6):
+        """
+        Execute a query, retrying transient connection failures
+        
+        Inserts are not routed through here: a lost response could otherwise
+        create the same record twice.
+        
+        Args:
+            run_query: Zero-argument function that builds and executes the query
+            max_retries: Number of retries after the first attempt
+            
+        Returns:
+            Query response
+        """
+        return retry_db_operation(
+            run_query,
+            max_retries=max_retries,
+            on_reconnect=db_connection.force_reconnect
+        )
     
     def test_connection(self) -> bool:
         """
@@ -46,11 +116,14 @@ class DatabaseService:
             bool: True if connection successful, False otherwise
         """
         try:
-            # Simple test query to verify connection
-            response = self.db_client.table('meetings').select('count', count='exact').execute()
+            # Cheap existence probe - avoids a full-table COUNT(*) on every call
+            response = self._execute(
+                lambda: self.db_client.table('meetings').select('id').limit(1).execute(),
+                max_retries=2
+            )
             return response.data is not None
         except Exception as e:
-            logger.error(f"Database connection test failed: {str(e)}")
+            logger.error("Database connection test failed: %s", e)
             return False
     
     def insert_record(self, table_name: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -66,14 +139,15 @@ class DatabaseService:
         """
         try:
             response = self.db_client.table(table_name).insert(data).execute()
+            self._invalidate(table_name)
             if response.data:
-                logger.info(f"Inserted record into {table_name}: {response.data[0].get('id', 'unknown')}")
+                logger.info("Inserted record into %s: %s", table_name, response.data[0].get('id', 'unknown'))
                 return response.data[0]
             else:
-                logger.error(f"Failed to insert record into {table_name}")
+                logger.error("Failed to insert record into %s", table_name)
                 return None
         except Exception as e:
-            logger.error(f"Error inserting record into {table_name}: {str(e)}")
+            logger.error("Error inserting record into %s: %s", table_name, e)
             return None
     
     def update_record(self, table_name: str, record_id: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -89,15 +163,18 @@ class DatabaseService:
             Optional[Dict[str, Any]]: Updated record or None if failed
         """
         try:
-            response = self.db_client.table(table_name).update(data).eq('id', record_id).execute()
+            response = self._execute(
+                lambda: self.db_client.table(table_name).update(data).eq('id', record_id).execute()
+            )
+            self._invalidate(table_name)
             if response.data:
-                logger.info(f"Updated record in {table_name}: {record_id}")
+                logger.info("Updated record in %s: %s", table_name, record_id)
                 return response.data[0]
             else:
-                logger.error(f"Failed to update record in {table_name}: {record_id}")
+                logger.error("Failed to update record in %s: %s", table_name, record_id)
                 return None
         except Exception as e:
-            logger.error(f"Error updating record in {table_name}: {str(e)}")
+            logger.error("Error updating record in %s: %s", table_name, e)
             return None
     
     def get_record_by_id(self, table_name: str, record_id: str) -> Optional[Dict[str, Any]]:
@@ -111,13 +188,22 @@ class DatabaseService:
         Returns:
             Optional[Dict[str, Any]]: Record or None if not found
         """
+        key = self._cache_key(table_name, 'id', record_id)
+        cached = self._cache_get(key)
+        if cached is not _MISSING:
+            return cached
+        
         try:
-            response = self.db_client.table(table_name).select('*').eq('id', record_id).execute()
+            response = self._execute(
+                lambda: self.db_client.table(table_name).select('*').eq('id', record_id).execute()
+            )
             if response.data:
+                # Only hits are cached; a missing record may be created at any time
+                self._cache_set(key, response.data[0])
                 return response.data[0]
             return None
         except Exception as e:
-            logger.error(f"Error getting record from {table_name}: {str(e)}")
+            logger.error("Error getting record from %s: %s", table_name, e)
             return None
     
     def get_records(self, table_name: str, filters: Dict[str, Any] = None, 
@@ -135,13 +221,12 @@ class DatabaseService:
         Returns:
             List[Dict[str, Any]]: List of records
         """
-        try:
+        def run_query():
             query = self.db_client.table(table_name).select('*')
             
-            # Apply filters
+            # Apply all equality filters in one call
             if filters:
-                for key, value in filters.items():
-                    query = query.eq(key, value)
+                query = query.match(filters)
             
             # Apply ordering
             if order_by:
@@ -152,39 +237,63 @@ class DatabaseService:
             
             # Apply pagination
             if limit is not None and offset is not None:
-                query = query.range(offset, offset + limit - 1)
+                query = query.limit(limit).offset(offset)
             
-            response = query.execute()
-            return response.data or []
+            return query.execute()
+        
+        key = self._cache_key(table_name, 'records', self._freeze_filters(filters), limit, offset, order_by)
+        cached = self._cache_get(key)
+        if cached is not _MISSING:
+            return cached
+        
+        try:
+            response = self._execute(run_query)
+            records = response.data or []
+            self._cache_set(key, records)
+            return records
             
         except Exception as e:
-            logger.error(f"Error getting records from {table_name}: {str(e)}")
+            logger.error("Error getting records from %s: %s", table_name, e)
             return []
     
-    def get_count(self, table_name: str, filters: Dict[str, Any] = None) -> int:
+    def get_count(self, table_name: str, filters: Dict[str, Any] = None, mode: str = 'estimated') -> int:
         """
         Get count of records in the specified table with optional filtering
         
         Args:
             table_name: Name of the table
             filters: Filter conditions
+            mode: 'estimated' (exact for small results, planner estimate above PostgREST's max rows),
+                'planned' (planner estimate) or 'exact' (full COUNT(*))
             
         Returns:
             int: Count of records
         """
-        try:
-            query = self.db_client.table(table_name).select('count', count='exact')
+        if mode not in COUNT_MODES:
+            raise ValueError(f"Invalid count mode: {mode}")
+        
+        def run_query():
+            query = self.db_client.table(table_name).select('count', count=mode)
             
-            # Apply filters
+            # Apply all equality filters in one call
             if filters:
-                for key, value in filters.items():
-                    query = query.eq(key, value)
+                query = query.match(filters)
             
-            response = query.execute()
-            return response.count or 0
+            return query.execute()
+        
+        key = self._cache_key(table_name, 'count', mode, self._freeze_filters(filters))
+        cached = self._cache_get(key)
+        if cached is not _MISSING:
+            return cached
+        
+        try:
+            response = self._execute(run_query)
+            count = response.count or 0
+            self._cache_set(key, count)
+            return count
             
         except Exception as e:
-            logger.error(f"Error getting count from {table_name}: {str(e)}")
+            logger.error("Error getting count from %s: %s", table_name, e)
             return 0
     
     def delete_record(self, table_name: str, record_id: str) -> bool:
@@ -199,34 +308,16 @@ class DatabaseService:
             bool: True if successful, False otherwise
         """
         try:
-            response = self.db_client.table(table_name).delete().eq('id', record_id).execute()
+            response = self._execute(
+                lambda: self.db_client.table(table_name).delete().eq('id', record_id).execute()
+            )
+            self._invalidate(table_name)
             if response.data:
-                logger.info(f"Deleted record from {table_name}: {record_id}")
+                logger.info("Deleted record from %s: %s", table_name, record_id)
                 return True
             else:
-                logger.error(f"Failed to delete record from {table_name}: {record_id}")
+                logger.error("Failed to delete record from %s: %s", table_name, record_id)
                 return False
         except Exception as e:
-            logger.error(f"Error deleting record from {table_name}: {str(e)}")
-            return False
-    
-    def execute_custom_query(self, query: str, params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
-        """
-        Execute a custom SQL query
-        
-        Args:
-            query: SQL query string
-            params: Query parameters
-            
-        Returns:
-            List[Dict[str, Any]]: Query results
-        """
-        try:
-            # Note: This is a simplified implementation
-            # In a real application, you might want to use raw SQL execution
-            # For Supabase, you typically use the query builder instead
-            logger.warning("Custom query execution not implemented for Supabase")
-            return []
-        except Exception as e:
-            logger.error(f"Error executing custom query: {str(e)}")
-            return [] 
\ No newline at end of file
+            logger.error("Error deleting record from %s: %s", table_name, e)
+            return False
\ No newline at end of file
@@ -0,0 +1,105 @@
+"""
+Health Service for Blog Automation System
+
+This module handles dependency health checks including:
+- Database connectivity
+- Cloudinary API reachability
+- Running all probes concurrently with a per-probe timeout
+- Caching the last result and running one refresh at a time to coalesce bursts of probes
+- Skipping the Cloudinary probe when no credentials are configured
+- Warming up connections at process start
+
+Output Types:
+- database: Boolean - Database probe result
+- cloudinary: Boolean or None - Cloudinary probe result (None when skipped)
+
+Author: Your Name
+Date: 2024
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+from utils.background_loop import run_async
+from utils.cloudinary_service import cloudinary_service
+from utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class HealthService:
+    """Service class for dependency health checks"""
+    
+    def __init__(self, db_service):
+        """
+        Initialize health service
+        
+        Args:
+            db_service: DatabaseService used for the database probe
+        """
+        self.db_service = db_service
+        self.cloudinary_service = cloudinary_service
+        self._lock = threading.Lock()
+        self._checked_at: Optional[float] = None
+        self._results: Dict[str, Optional[bool]] = {}
+    
+    def check(self) -> Dict[str, Optional[bool]]:
+        """
+        Get the health of every dependency, reusing a recent result if available
+        
+        The lock is held while probing, so when the cached result expires one
+        caller runs the probes and concurrent callers reuse its result.
+        
+        Returns:
+            Dict[str, Optional[bool]]: Probe result per dependency name (None if skipped)
+        """
+        with self._lock:
+            if self._checked_at is None or time.monotonic() - self._checked_at > settings.HEALTH_CACHE_TTL:
+                self._results = run_async(self._run_probes())
+                self._checked_at = time.monotonic()
+            return self._results
+    
+    def warm_up(self) -> None:
+        """
+        Open database and Cloudinary connections ahead of the first request
+        
+        Runs the probes once so the TLS sessions and HTTP pools are populated
+        before traffic arrives.
+        """
+        started = time.monotonic()
+        try:
+            results = self.check()
+            logger.info("Connection warmup finished in %.3fs: %s", time.monotonic() - started, results)
+        except Exception as e:
+            logger.error("Connection warmup failed: %s", e)
+    
+    async def _run_probes(self) -> Dict[str, Optional[bool]]:
+        """Run all probes concurrently, each bounded by settings.HEALTH_PROBE_TIMEOUT"""
+        probes = {'database': self.probe_db()}
+        # Deployments that never upload media leave Cloudinary unconfigured
+        if self.cloudinary_service.has_credentials():
+            probes['cloudinary'] = self.probe_cloudinary()
+        
+        outcomes = await asyncio.gather(
+            *(asyncio.wait_for(probe, settings.HEALTH_PROBE_TIMEOUT) for probe in probes.values()),
+            return_exceptions=True
+        )
+        
+        results = {}
+        for name, outcome in zip(probes, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error("Health probe '%s' failed: %r", name, outcome)
+            results[name] = outcome is True
+        results.setdefault('cloudinary', None)
+        return results
+    
+    async def probe_db(self) -> bool:
+        """Check database connectivity"""
+        return await asyncio.to_thread(self.db_service.test_connection)
+    
+    async def probe_cloudinary(self) -> bool:
+        """Check Cloudinary reachability (the SDK is synchronous)"""
+        return await asyncio.to_thread(self.cloudinary_service.ping)
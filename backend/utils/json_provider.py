@@ -0,0 +1,45 @@
+"""
+JSON Provider for Blog Automation System
+
+This module plugs orjson into Flask including:
+- Serializing every jsonify() response with orjson
+- Parsing request bodies (request.get_json()) with orjson
+- Falling back to Flask's default conversions for types orjson lacks (Decimal, etc.)
+
+Author: Your Name
+Date: 2024
+"""
+
+from typing import Any
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson"""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serialize data as JSON
+
+        Args:
+            obj: Data to serialize
+            **kwargs: Ignored (orjson output is always compact)
+
+        Returns:
+            str: JSON document
+        """
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        """
+        Deserialize JSON data
+
+        Args:
+            s: JSON document (str or bytes)
+            **kwargs: Ignored
+
+        Returns:
+            Any: Parsed data
+        """
+        return orjson.loads(s)
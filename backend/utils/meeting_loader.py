@@ -0,0 +1,135 @@
+"""
+Meeting Loader for Blog Automation System
+
+This module coalesces meeting lookups by ID including:
+- Collecting concurrent get-by-ID requests for a short window
+- Resolving a whole batch with a single `id IN (...)` query
+- Handing each caller its own row (or None if not found)
+
+Lookups run on the shared background event loop, so requests handled by
+different worker threads are batched together.
+
+Input Types:
+- meeting_id: String - Meeting ID (UUID)
+
+Output Types:
+- meeting: Dict[str, Any] or None
+
+Author: Your Name
+Date: 2024
+"""
+
+import asyncio
+import logging
+import uuid
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from db import get_db_client
+from utils.background_loop import run_async
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for more lookups before querying
+MEETING_BATCH_WINDOW = 0.005
+
+# Pending lookups that trigger an immediate query
+MEETING_BATCH_SIZE = 100
+
+class MeetingLoader:
+    """Batches concurrent meeting lookups into a single query"""
+
+    def __init__(self, batch_window: float = MEETING_BATCH_WINDOW, max_batch_size: int = MEETING_BATCH_SIZE):
+        """
+        Initialize meeting loader
+
+        Args:
+            batch_window: Seconds to wait for more lookups before querying
+            max_batch_size: Pending lookups that trigger an immediate query
+        """
+        self.db_client = get_db_client()
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self._pending: Deque[Tuple[str, asyncio.Future]] = deque()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+    def load_sync(self, meeting_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a meeting from synchronous code (e.g. a Flask handler)
+
+        Args:
+            meeting_id: Meeting ID
+
+        Returns:
+            Optional[Dict[str, Any]]: Meeting record or None if not found
+        """
+        return run_async(self.load(meeting_id))
+
+    async def load(self, meeting_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a meeting, sharing the query with other lookups in the same window
+
+        Args:
+            meeting_id: Meeting ID
+
+        Returns:
+            Optional[Dict[str, Any]]: Meeting record or None if not found
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((meeting_id, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Take all pending lookups and dispatch them as one batch"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch = list(self._pending)
+        self._pending.clear()
+        if batch:
+            asyncio.ensure_future(self._dispatch(batch))
+
+    async def _dispatch(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        """Query all meetings in the batch and resolve each caller's future"""
+        # A malformed ID would make PostgREST reject the whole IN (...) query
+        meeting_ids = [mid for mid in dict.fromkeys(mid for mid, _ in batch) if self._is_valid_uuid(mid)]
+
+        try:
+            rows = await asyncio.to_thread(self._fetch_meetings, meeting_ids) if meeting_ids else []
+        except Exception as e:
+            logger.error("Error loading meeting batch: %s", e)
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        rows_by_id = {row['id']: row for row in rows}
+        for meeting_id, future in batch:
+            if not future.done():
+                future.set_result(rows_by_id.get(str(meeting_id).lower()))
+
+    def _fetch_meetings(self, meeting_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get meetings by ID from database"""
+        response = self.db_client.table('meetings').select('*').in_('id', meeting_ids).execute()
+        logger.debug("Loaded %d meetings in one query", len(meeting_ids))
+        return response.data or []
+
+    @staticmethod
+    def _is_valid_uuid(value: str) -> bool:
+        """Check that a value parses as a UUID"""
+        try:
+            uuid.UUID(str(value))
+            return True
+        except ValueError:
+            return False
+
+# Global meeting loader instance
+meeting_loader = MeetingLoader()
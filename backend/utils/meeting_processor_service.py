@@ -10,16 +10,132 @@ Date: 2024
 
 import logging
 import asyncio
-import uuid
-from typing import Dict, Any, Tuple, Optional
-from datetime import datetime
-import requests
+import atexit
+import itertools
+import re
+import time
+from typing import Dict, Any, Tuple, Optional, List, Iterator, Set
+from datetime import datetime, timezone
+import aiohttp
+from cachetools import TTLCache
+import orjson
 import os
 
 from db import get_db_client
+from utils import background_loop
+from utils.config import settings
+from utils.retry import RETRYABLE_WEBHOOK_STATUS_CODES, CircuitBreaker, backoff_delay
 
 logger = logging.getLogger(__name__)
 
+# Canonical hyphenated UUID (case-insensitive)
+_UUID_RE = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE)
+
+# Maximum number of meeting IDs accepted by process_meeting_ids
+MAX_BATCH_MEETINGS = 100
+
+# Meeting IDs per Supabase `id=in.(...)` request (keeps the URL short)
+SUPABASE_FETCH_CHUNK = 100
+
+# Rows per bulk insert/upsert request
+DB_WRITE_CHUNK = 500
+
+# Unique key linking a local meeting to its Supabase meeting (see scripts/add-supabase-meeting-id.sql)
+MEETING_UPSERT_CONFLICT = 'organization_id,supabase_meeting_id'
+
+# Keep-alive connection pool for outbound HTTP (total size: settings.HTTP_POOL_SIZE)
+HTTP_POOL_SIZE_PER_HOST = 20
+HTTP_KEEPALIVE_TIMEOUT = 30
+
+# Default timeout for outbound requests (Supabase REST)
+HTTP_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+# Fetched meetings with a transcript are reused (finalized transcripts don't change;
+# TTL: settings.SUPABASE_MEETING_CACHE_TTL)
+SUPABASE_MEETING_CACHE_SIZE = 1024
+
+# Per-process sequence for meeting codes
+_MEETING_CODE_COUNTER = itertools.count()
+
+def generate_meeting_code() -> str:
+    """
+    Generate a meeting code without drawing random bytes
+    
+    Seconds since the epoch, the process ID and a per-process counter make
+    codes unique across gunicorn workers on a host (up to 65536 codes per
+    process per second) and roughly time-ordered.
+    
+    Returns:
+        str: Meeting code, e.g. MEET_6650f1a2003d0001
+    """
+    return f"MEET_{int(time.time()):08x}{os.getpid() & 0xffff:04x}{next(_MEETING_CODE_COUNTER) & 0xffff:04x}"
+
+# Maximum time to wait for the Make.com webhook to respond
+# (connect bounds getting a connection, so connect failures surface quickly)
+WEBHOOK_TIMEOUT = aiohttp.ClientTimeout(total=300, connect=10)
+
+# Failures raised before the request reached Make.com; only these are resent.
+# ServerTimeoutError only comes from the connect timeout (no sock_read is set).
+WEBHOOK_CONNECT_ERRORS = (aiohttp.ClientConnectorError, aiohttp.ServerTimeoutError)
+
+# Retries for 429/502/503/504 and connect failures: full-jitter backoff from 1s, capped at 32s
+WEBHOOK_MAX_RETRIES = 5
+WEBHOOK_RETRY_BASE_DELAY = 1
+WEBHOOK_RETRY_MAX_DELAY = 32
+
+# Consecutive webhook failures that pause calls, and for how many seconds
+WEBHOOK_BREAKER_THRESHOLD = 5
+WEBHOOK_BREAKER_COOLDOWN = 60
+
+# Shared HTTP session, bound to the event loop it was created on
+_http_session: Optional[aiohttp.ClientSession] = None
+
+def get_http_session() -> aiohttp.ClientSession:
+    """
+    Get the shared aiohttp session, creating it on first use
+    
+    Must be called from a coroutine. A new session is created if the
+    previous one was closed or belongs to another event loop (e.g. after fork).
+    
+    Returns:
+        aiohttp.ClientSession: Session for outbound HTTP requests
+    """
+    global _http_session
+    
+    loop = asyncio.get_running_loop()
+    if _http_session is None or _http_session.closed or _http_session._loop is not loop:
+        connector = aiohttp.TCPConnector(
+            limit=settings.HTTP_POOL_SIZE,
+            limit_per_host=HTTP_POOL_SIZE_PER_HOST,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=300
+        )
+        # No default auth headers: the session is also used for Make.com
+        _http_session = aiohttp.ClientSession(connector=connector, timeout=HTTP_TIMEOUT)
+    return _http_session
+
+def close_http_session() -> None:
+    """Close the shared aiohttp session on shutdown"""
+    global _http_session
+    
+    session, _http_session = _http_session, None
+    loop = background_loop.BACKGROUND_LOOP
+    if session is None or session.closed or loop is None or session._loop is not loop or not loop.is_running():
+        return
+    
+    try:
+        background_loop.run_async(session.close(), timeout=5)
+    except Exception as e:
+        logger.warning("Error closing HTTP session: %s", e)
+
+# Registered after background_loop's handler, so it runs before the loop stops
+atexit.register(close_http_session)
+
+def _chunks(items: List[Any], size: int) -> Iterator[List[Any]]:
+    """Yield successive slices of at most `size` items"""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
 class MeetingProcessorService:
     """Service class for processing meeting IDs"""
     
@@ -30,6 +146,19 @@ class MeetingProcessorService:
         self.make_webhook_url = os.getenv('MAKE_MEETING_ID_WEBHOOK_URL') or os.getenv('MAKE_WEBHOOK_URL')
         self.supabase_url = os.getenv('SUPABASE_URL')
         self.supabase_key = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
+        # Only touched from the event loop thread, so no lock is needed
+        self._meeting_cache = TTLCache(maxsize=SUPABASE_MEETING_CACHE_SIZE, ttl=settings.SUPABASE_MEETING_CACHE_TTL)
+        self._webhook_semaphore: Optional[asyncio.Semaphore] = None
+        self._webhook_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Strong references to in-flight webhook tasks (the loop only keeps weak ones)
+        self._webhook_tasks: Set[asyncio.Task] = set()
+        self._webhook_breaker = CircuitBreaker(WEBHOOK_BREAKER_THRESHOLD, WEBHOOK_BREAKER_COOLDOWN)
+        # Built once; only ever sent to Supabase
+        self.supabase_headers = {
+            'apikey': self.supabase_key,
+            'Authorization': f'Bearer {self.supabase_key}',
+            'Content-Type': 'application/json'
+        }
     
     async def process_meeting_id(self, meeting_id: str, organization_id: str) -> Tuple[Dict[str, Any], int]:
         """
@@ -43,7 +172,7 @@ class MeetingProcessorService:
             Tuple[Dict[str, Any], int]: Response data and HTTP status code
         """
         try:
-            logger.info(f"Processing meeting ID: {meeting_id}")
+            logger.info("Processing meeting ID: %s", meeting_id)
             
             # Validate meeting ID format
             if not self._is_valid_uuid(meeting_id):
@@ -67,8 +196,8 @@ class MeetingProcessorService:
             # Create or update meeting record in our database
             local_meeting = await self._create_or_update_meeting(meeting_id, organization_id, meeting_data)
             
-            # Trigger content generation webhook
-            await self._trigger_content_generation_webhook(local_meeting['id'], meeting_data)
+            # Trigger content generation webhook in the background; Make.com can take minutes
+            self._dispatch_webhook(local_meeting['id'], meeting_data)
             
             return {
                 'success': True,
@@ -82,11 +211,84 @@ class MeetingProcessorService:
             }, 200
             
         except Exception as e:
-            logger.error(f"Error processing meeting ID: {str(e)}")
+            logger.error("Error processing meeting ID: %s", e)
             return {
                 'error': f'Failed to process meeting: {str(e)}'
             }, 500
     
+    async def process_meeting_ids(self, meeting_ids: List[str], organization_id: str) -> Tuple[Dict[str, Any], int]:
+        """
+        Process several meeting IDs with batched Supabase reads and database writes
+        
+        Args:
+            meeting_ids: Meeting IDs from Supabase
+            organization_id: Organization ID
+            
+        Returns:
+            Tuple[Dict[str, Any], int]: Response data (processed meetings and per-ID errors) and HTTP status code
+        """
+        try:
+            # UUIDs are case-insensitive, so normalise before deduping
+            meeting_ids = list(dict.fromkeys(str(meeting_id).strip().lower() for meeting_id in meeting_ids))
+            if len(meeting_ids) > MAX_BATCH_MEETINGS:
+                return {
+                    'error': f'At most {MAX_BATCH_MEETINGS} meeting IDs can be processed at once'
+                }, 400
+            
+            logger.info("Processing %s meeting IDs", len(meeting_ids))
+            
+            errors = []
+            valid_ids = []
+            for meeting_id in meeting_ids:
+                if self._is_valid_uuid(meeting_id):
+                    valid_ids.append(meeting_id)
+                else:
+                    errors.append({'meeting_id': meeting_id, 'error': 'Invalid meeting ID format'})
+            
+            # Fetch all meetings from Supabase
+            fetched = await self._fetch_meetings_from_supabase(valid_ids) if valid_ids else {}
+            
+            ready = []
+            for meeting_id in valid_ids:
+                key = meeting_id.lower()
+                if key not in fetched:
+                    errors.append({'meeting_id': meeting_id, 'error': 'Meeting not found in Supabase'})
+                elif not fetched[key] or not fetched[key].get('transcript'):
+                    errors.append({'meeting_id': meeting_id, 'error': 'Meeting does not have a transcript'})
+                else:
+                    ready.append((meeting_id, fetched[key]))
+            
+            # Create or update all meeting records in our database (one row per Supabase meeting)
+            to_save = {meeting_id.lower(): meeting_data for meeting_id, meeting_data in ready}
+            local_meetings = await self._create_or_update_meetings(organization_id, to_save) if to_save else {}
+            
+            processed = []
+            for meeting_id, meeting_data in ready:
+                local_meeting = local_meetings[meeting_id.lower()]
+                processed.append({
+                    'meeting_id': local_meeting['id'],
+                    'supabase_meeting_id': meeting_id,
+                    'title': meeting_data.get('title', ''),
+                    'transcript_available': True
+                })
+            
+            # Trigger content generation webhooks in the background
+            for item, (_, meeting_data) in zip(processed, ready):
+                self._dispatch_webhook(item['meeting_id'], meeting_data)
+            
+            return {
+                'success': bool(processed),
+                'message': f'Processing started for {len(processed)} of {len(meeting_ids)} meetings',
+                'data': processed,
+                'errors': errors
+            }, 200 if processed else 400
+            
+        except Exception as e:
+            logger.error("Error processing meeting IDs: %s", e)
+            return {
+                'error': f'Failed to process meetings: {str(e)}'
+            }, 500
+    
     async def _fetch_meeting_from_supabase(self, meeting_id: str) -> Optional[Dict[str, Any]]:
         """
         Fetch meeting data from Supabase
@@ -97,59 +299,142 @@ class MeetingProcessorService:
         Returns:
             Optional[Dict[str, Any]]: Meeting data or None if not found
         """
+        cached = self._meeting_cache.get(meeting_id.lower())
+        if cached is not None:
+            return cached
+        
         try:
-            # Make request to Supabase API
-            headers = {
-                'apikey': self.supabase_key,
-                'Authorization': f'Bearer {self.supabase_key}',
-                'Content-Type': 'application/json'
-            }
-            
-            # First, fetch the meeting details from meetings table
-            meetings_url = f"{self.supabase_url}/rest/v1/meetings?id=eq.{meeting_id}&select=*"
-            meetings_response = requests.get(meetings_url, headers=headers)
+            # Fetch the meeting with its transcript/summary embedded (one round trip)
+            meetings_url = (
+                f"{self.supabase_url}/rest/v1/meetings?id=eq.{meeting_id}"
+                f"&select=*,meeting_minutes(id,transcript,summary)"
+            )
+            meetings_status, meetings_data = await self._get_json(get_http_session(), meetings_url, self.supabase_headers)
             
-            if meetings_response.status_code != 200:
-                logger.error(f"Supabase meetings API error: {meetings_response.status_code} - {meetings_response.text}")
+            if meetings_status != 200:
+                logger.error("Supabase meetings API error: %s - %s", meetings_status, meetings_data)
                 return None
             
-            meetings_data = meetings_response.json()
             if not meetings_data or len(meetings_data) == 0:
-                logger.warning(f"Meeting not found in Supabase meetings table: {meeting_id}")
-                return None
-            
-            meeting_info = meetings_data[0]
-            
-            # Then, fetch the transcript and summary from meeting_minutes table
-            minutes_url = f"{self.supabase_url}/rest/v1/meeting_minutes?meeting_id=eq.{meeting_id}&select=*"
-            minutes_response = requests.get(minutes_url, headers=headers)
-            
-            if minutes_response.status_code != 200:
-                logger.error(f"Supabase meeting_minutes API error: {minutes_response.status_code} - {minutes_response.text}")
+                logger.warning("Meeting not found in Supabase meetings table: %s", meeting_id)
                 return None
             
-            minutes_data = minutes_response.json()
-            if not minutes_data or len(minutes_data) == 0:
-                logger.warning(f"Meeting minutes not found in Supabase: {meeting_id}")
+            combined_data = self._combine_meeting_minutes(meetings_data[0])
+            if not combined_data:
+                logger.warning("Meeting minutes not found in Supabase: %s", meeting_id)
                 return None
             
-            meeting_minutes = minutes_data[0]
-            
-            # Combine meeting info with transcript and summary
-            combined_data = {
-                **meeting_info,
-                'transcript': meeting_minutes.get('transcript', ''),
-                'summary': meeting_minutes.get('summary', ''),
-                'minutes_id': meeting_minutes.get('id')
-            }
-            
-            logger.info(f"Fetched meeting and minutes from Supabase: {meeting_id}")
+            logger.info("Fetched meeting and minutes from Supabase: %s", meeting_id)
+            self._cache_meeting(meeting_id, combined_data)
             return combined_data
                 
         except Exception as e:
-            logger.error(f"Error fetching meeting from Supabase: {str(e)}")
+            logger.error("Error fetching meeting from Supabase: %s", e)
             return None
     
+    async def _fetch_meetings_from_supabase(self, meeting_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetch several meetings with their minutes from Supabase
+        
+        Args:
+            meeting_ids: Meeting IDs (validated UUIDs)
+            
+        Returns:
+            Dict[str, Optional[Dict[str, Any]]]: Meeting data by lowercased ID (None if the meeting has no minutes);
+                meetings that were not found are absent
+            
+        Raises:
+            Exception: If a Supabase request fails
+        """
+        meetings = {}
+        missing = []
+        for meeting_id in meeting_ids:
+            cached = self._meeting_cache.get(meeting_id.lower())
+            if cached is not None:
+                meetings[meeting_id.lower()] = cached
+            else:
+                missing.append(meeting_id)
+        
+        session = get_http_session()
+        headers = self.supabase_headers
+        urls = [
+            f"{self.supabase_url}/rest/v1/meetings?id=in.({','.join(chunk)})"
+            f"&select=*,meeting_minutes(id,transcript,summary)"
+            for chunk in _chunks(missing, SUPABASE_FETCH_CHUNK)
+        ]
+        responses = await asyncio.gather(*(self._get_json(session, url, headers) for url in urls))
+        
+        for status, rows in responses:
+            if status != 200:
+                raise Exception(f"Supabase meetings API error: {status} - {rows}")
+            for row in rows:
+                combined_data = self._combine_meeting_minutes(row)
+                meetings[str(row['id']).lower()] = combined_data
+                self._cache_meeting(str(row['id']), combined_data)
+        
+        logger.info("Fetched %s/%s meetings from Supabase (%s cached)", len(meetings), len(meeting_ids), len(meeting_ids) - len(missing))
+        return meetings
+    
+    def _cache_meeting(self, meeting_id: str, meeting_data: Optional[Dict[str, Any]]) -> None:
+        """
+        Remember fetched meeting data if it has a transcript
+        
+        Meetings without minutes or transcript are not cached so that a
+        transcript added later is picked up on the next request.
+        
+        Args:
+            meeting_id: Supabase meeting ID
+            meeting_data: Combined meeting data (or None)
+        """
+        if meeting_data and meeting_data.get('transcript'):
+            self._meeting_cache[meeting_id.lower()] = meeting_data
+    
+    def _combine_meeting_minutes(self, meeting_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Merge a meeting row's embedded minutes into the meeting data
+        
+        Args:
+            meeting_info: Meeting row with an embedded `meeting_minutes` resource
+            
+        Returns:
+            Optional[Dict[str, Any]]: Meeting data with transcript and summary, or None if it has no minutes
+        """
+        # Embedded rows come back as a list (or a single object for a one-to-one relation)
+        minutes_data = meeting_info.pop('meeting_minutes', None)
+        if isinstance(minutes_data, dict):
+            minutes_data = [minutes_data]
+        
+        if not minutes_data:
+            return None
+        
+        meeting_minutes = minutes_data[0]
+        
+        # Combine meeting info with transcript and summary
+        return {
+            **meeting_info,
+            'transcript': meeting_minutes.get('transcript', ''),
+            'summary': meeting_minutes.get('summary', ''),
+            'minutes_id': meeting_minutes.get('id')
+        }
+    
+    async def _get_json(self, session: aiohttp.ClientSession, url: str, headers: Dict[str, str]) -> Tuple[int, Any]:
+        """
+        GET a URL and decode the response
+        
+        Args:
+            session: HTTP session
+            url: Request URL
+            headers: Request headers
+            
+        Returns:
+            Tuple[int, Any]: HTTP status and parsed JSON (response text if not 200)
+        """
+        async with session.get(url, headers=headers) as response:
+            if response.status != 200:
+                return response.status, await response.text()
+            # Transcripts can be large; orjson decodes them much faster than the stdlib
+            return response.status, orjson.loads(await response.read())
+    
     async def _create_or_update_meeting(self, supabase_meeting_id: str, organization_id: str, meeting_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create or update meeting record in local database
@@ -163,34 +448,104 @@ class MeetingProcessorService:
             Dict[str, Any]: Created/updated meeting record
         """
         try:
-            # Check if meeting already exists by title and organization (since we don't have supabase_meeting_id column)
-            existing_meeting = self.db_client.table('meetings').select('*').eq('title', meeting_data.get('title', '')).eq('organization_id', organization_id).execute()
-            
-            meeting_record = {
-                'organization_id': organization_id,
-                'title': meeting_data.get('title', ''),
-                'meeting_code': f"MEET_{str(uuid.uuid4())[:8]}",
-                'scheduled_at': datetime.now().isoformat(),
-                'description': meeting_data.get('description', ''),
-                'updated_at': datetime.now().isoformat()
-            }
+            meeting_record = self._build_meeting_record(supabase_meeting_id, organization_id, meeting_data)
             
-            if existing_meeting.data:
-                # Update existing meeting with new transcript
-                response = self.db_client.table('meetings').update(meeting_record).eq('id', existing_meeting.data[0]['id']).execute()
-                logger.info(f"Updated existing meeting with transcript: {existing_meeting.data[0]['id']}")
-                return response.data[0]
-            else:
-                # Create new meeting
-                meeting_record['created_at'] = datetime.now().isoformat()
-                response = self.db_client.table('meetings').insert(meeting_record).execute()
-                logger.info(f"Created new meeting with transcript: {response.data[0]['id']}")
-                return response.data[0]
+            # Insert, or update the row already linked to this Supabase meeting, in one statement
+            response = await asyncio.to_thread(
+                self.db_client.table('meetings').upsert(meeting_record, on_conflict=MEETING_UPSERT_CONFLICT).execute
+            )
+            logger.info("Upserted meeting with transcript: %s", response.data[0]['id'])
+            return response.data[0]
                 
         except Exception as e:
-            logger.error(f"Error creating/updating meeting: {str(e)}")
+            logger.error("Error creating/updating meeting: %s", e)
+            raise
+    
+    async def _create_or_update_meetings(self, organization_id: str, meetings: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Create or update several meeting records with bulk upserts
+        
+        Args:
+            organization_id: Organization ID
+            meetings: Meeting data from Supabase by lowercased Supabase meeting ID
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: Created/updated meeting records by lowercased Supabase meeting ID
+        """
+        try:
+            now_iso = datetime.now(timezone.utc).isoformat()
+            records = [
+                self._build_meeting_record(supabase_meeting_id, organization_id, meeting_data, now_iso)
+                for supabase_meeting_id, meeting_data in meetings.items()
+            ]
+            
+            saved = {}
+            for chunk in _chunks(records, DB_WRITE_CHUNK):
+                response = await asyncio.to_thread(
+                    self.db_client.table('meetings').upsert(chunk, on_conflict=MEETING_UPSERT_CONFLICT).execute
+                )
+                saved.update((str(row['supabase_meeting_id']).lower(), row) for row in response.data)
+            
+            logger.info("Upserted %s meetings with transcripts", len(saved))
+            return saved
+            
+        except Exception as e:
+            logger.error("Error creating/updating meetings: %s", e)
             raise
     
+    def _build_meeting_record(self, supabase_meeting_id: str, organization_id: str, meeting_data: Dict[str, Any],
+                              now_iso: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Build the local meeting row for a Supabase meeting
+        
+        created_at is left to the column default so an upsert never overwrites it.
+        
+        Args:
+            supabase_meeting_id: Meeting ID from Supabase
+            organization_id: Organization ID
+            meeting_data: Meeting data from Supabase
+            now_iso: UTC timestamp to use for scheduled_at/updated_at (default: now)
+            
+        Returns:
+            Dict[str, Any]: Meeting record (without id/created_at)
+        """
+        now_iso = now_iso or datetime.now(timezone.utc).isoformat()
+        return {
+            'organization_id': organization_id,
+            'supabase_meeting_id': supabase_meeting_id,
+            'title': meeting_data.get('title', ''),
+            'meeting_code': generate_meeting_code(),
+            'scheduled_at': now_iso,
+            'description': meeting_data.get('description', ''),
+            'updated_at': now_iso
+        }
+    
+    def _dispatch_webhook(self, meeting_id: str, meeting_data: Dict[str, Any]) -> None:
+        """
+        Start the content generation webhook without waiting for it
+        
+        Must be called from a coroutine on the event loop that should run the task.
+        
+        Args:
+            meeting_id: Local meeting ID
+            meeting_data: Meeting data from Supabase
+        """
+        task = asyncio.ensure_future(self._guarded_webhook(meeting_id, meeting_data))
+        self._webhook_tasks.add(task)
+        task.add_done_callback(self._webhook_tasks.discard)
+    
+    async def _guarded_webhook(self, meeting_id: str, meeting_data: Dict[str, Any]) -> None:
+        """Trigger the content generation webhook, capping concurrent calls"""
+        async with self._get_webhook_semaphore(asyncio.get_running_loop()):
+            await self._trigger_content_generation_webhook(meeting_id, meeting_data)
+    
+    def _get_webhook_semaphore(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        """Get the webhook concurrency semaphore, creating it for the current event loop"""
+        if self._webhook_semaphore is None or self._webhook_semaphore_loop is not loop:
+            self._webhook_semaphore = asyncio.Semaphore(settings.WEBHOOK_CONCURRENCY)
+            self._webhook_semaphore_loop = loop
+        return self._webhook_semaphore
+    
     async def _trigger_content_generation_webhook(self, meeting_id: str, meeting_data: Dict[str, Any]) -> None:
         """
         Trigger content generation webhook for meeting ID flow
@@ -210,22 +565,87 @@ class MeetingProcessorService:
                 'source': 'supabase'
             }
             
-            response = requests.post(
-                self.make_webhook_url,
-                json=webhook_data,
-                headers={'Content-Type': 'application/json'},
-                timeout=300
-            )
-            
-            if response.status_code != 200:
-                logger.warning(f"Content generation webhook failed: {response.status_code}")
-            else:
-                logger.info("Content generation webhook triggered successfully")
+            await self._post_webhook_with_retry(self.make_webhook_url, orjson.dumps(webhook_data))
                 
         except Exception as e:
-            logger.error(f"Error triggering content generation webhook: {str(e)}")
+            logger.error("Error triggering content generation webhook: %s", e)
             # Don't raise exception - webhook failure shouldn't fail the process
     
+    async def _post_webhook_with_retry(self, url: str, body: bytes) -> bool:
+        """
+        POST a webhook, retrying only failures where the scenario cannot have run
+        
+        The trigger is not idempotent (each run creates blog and social posts),
+        so only connect failures, 429 and 502/503/504 are retried. Timeouts
+        after the request was sent, dropped connections, 500 and other 4xx are
+        final. While the circuit breaker is open the call is skipped.
+        
+        Args:
+            url: Webhook URL
+            body: JSON request body
+            
+        Returns:
+            bool: True if the webhook accepted the request
+        """
+        for attempt in range(WEBHOOK_MAX_RETRIES + 1):
+            if not self._webhook_breaker.allow():
+                logger.warning("Content generation webhook skipped: circuit open after repeated failures")
+                return False
+            
+            retry_after = None
+            try:
+                async with get_http_session().post(
+                    url,
+                    data=body,
+                    headers={'Content-Type': 'application/json'},
+                    timeout=WEBHOOK_TIMEOUT
+                ) as response:
+                    status = response.status
+                    retry_after = response.headers.get('Retry-After')
+                error = f"HTTP {status}"
+            except WEBHOOK_CONNECT_ERRORS as e:
+                # Never reached Make.com, so resending cannot duplicate posts
+                status = None
+                error = repr(e)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # The scenario may already be running; a resend could post twice
+                self._webhook_breaker.record_failure()
+                logger.error("Content generation webhook failed after sending, not retried: %r", e)
+                return False
+            except BaseException:
+                # Cancellation or an unexpected error: still record an outcome so a
+                # half-open trial can't leave the breaker refusing calls for good
+                self._webhook_breaker.record_failure()
+                raise
+            
+            if status is not None and status < 300:
+                self._webhook_breaker.record_success()
+                logger.info("Content generation webhook triggered successfully")
+                return True
+            
+            if status is not None and status not in RETRYABLE_WEBHOOK_STATUS_CODES:
+                # Final: a 4xx won't change on retry and a 500 may have run the scenario
+                if status >= 500:
+                    self._webhook_breaker.record_failure()
+                else:
+                    self._webhook_breaker.record_success()
+                logger.warning("Content generation webhook failed: %s", status)
+                return False
+            
+            self._webhook_breaker.record_failure()
+            if attempt == WEBHOOK_MAX_RETRIES:
+                break
+            
+            delay = backoff_delay(attempt, WEBHOOK_RETRY_BASE_DELAY, WEBHOOK_RETRY_MAX_DELAY, retry_after)
+            logger.warning(
+                "Content generation webhook failed (attempt %d/%d), retrying in %.2fs: %s",
+                attempt + 1, WEBHOOK_MAX_RETRIES + 1, delay, error
+            )
+            await asyncio.sleep(delay)
+        
+        logger.error("Content generation webhook failed after %d attempts: %s", WEBHOOK_MAX_RETRIES + 1, error)
+        return False
+    
 
     
     def _is_valid_uuid(self, uuid_string: str) -> bool:
@@ -238,6 +658,4 @@ class MeetingProcessorService:
         Returns:
             bool: True if valid UUID format
         """
-        import re
-        uuid_pattern = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE)
-        return bool(uuid_pattern.match(uuid_string)) 
\ No newline at end of file
+        return bool(_UUID_RE.match(uuid_string)) 
\ No newline at end of file
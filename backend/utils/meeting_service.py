@@ -6,12 +6,14 @@ This module handles all meeting management operations including:
 - Getting processing status
 - Listing meetings by organization
 - Meeting data retrieval
+- Full transcript retrieval
 
 Input Types:
 - meeting_id: String (path parameter)
 - organization_id: String (query parameter)
 - limit: Integer (query parameter, optional)
 - offset: Integer (query parameter, optional)
+- cursor: String (query parameter, optional) - Opaque keyset cursor from a previous page
 
 Output Types:
 - meeting_id: String
@@ -22,25 +24,97 @@ Output Types:
 - total: Integer
 - limit: Integer
 - offset: Integer
+- next_cursor: String or None - Cursor for the next page of meetings
 
 Author: Your Name
 Date: 2024
 """
 
 from flask import jsonify
+import base64
+import json
 import logging
-from typing import Dict, Any, Tuple, List
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Dict, Any, Tuple, List, Optional
+
+from cachetools import TTLCache
 
 from db import get_db_client
+from utils.config import settings
+from utils.meeting_loader import meeting_loader
 
 logger = logging.getLogger(__name__)
 
+# Cached per-organization meeting counts (TTL: settings.MEETINGS_COUNT_CACHE_TTL)
+MEETINGS_COUNT_CACHE_SIZE = 1024
+
+# Column projections, so large columns (e.g. transcripts) are not sent when unused.
+# The meetings table predates scripts/ (no CREATE TABLE in the repo); these are the
+# columns every meeting insert writes (MeetingProcessorService._build_meeting_record),
+# plus id, created_at (add-supabase-meeting-id.sql) and transcription_status
+# (fix-meetings-table.sql). processing_logs keeps select('*'): setup-database.sql
+# names its columns step_name/data but complete-database-setup.sql uses step/details.
+MEETING_STATUS_COLUMNS = 'id,title,transcription_status,created_at'
+MEETING_LIST_COLUMNS = 'id,title,organization_id,meeting_code,description,scheduled_at,transcription_status,created_at,updated_at'
+
+# Organization IDs per IN (...) lookup, keeping request URLs well under proxy limits
+ORGANIZATION_LOOKUP_CHUNK = 500
+
+# Characters of transcript included in list responses (full text: GET /api/meetings/<id>/transcript)
+TRANSCRIPT_PREVIEW_LENGTH = 500
+
+# Loads a meeting's related records in parallel (queries block on network I/O)
+_related_query_executor = ThreadPoolExecutor(max_workers=settings.RELATED_QUERY_WORKERS, thread_name_prefix='meeting-related')
+
+def encode_cursor(meeting: Dict[str, Any]) -> str:
+    """
+    Encode a keyset pagination cursor pointing after a meeting
+    
+    Args:
+        meeting: Last meeting on the current page (needs created_at and id)
+        
+    Returns:
+        str: URL-safe opaque cursor
+    """
+    payload = json.dumps({'created_at': meeting['created_at'], 'id': meeting['id']}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """
+    Decode a keyset pagination cursor
+    
+    Args:
+        cursor: Cursor from encode_cursor
+        
+    Returns:
+        Tuple[str, str]: created_at and id of the last meeting on the previous page
+        
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        created_at, meeting_id = str(data['created_at']), str(uuid.UUID(str(data['id'])))
+    except Exception:
+        raise ValueError('Invalid cursor')
+    
+    # The timestamp is embedded in a quoted PostgREST filter value
+    if '"' in created_at or '\\' in created_at:
+        raise ValueError('Invalid cursor')
+    return created_at, meeting_id
+
 class MeetingService:
     """Service class for meeting management operations"""
     
     def __init__(self):
         """Initialize meeting service"""
         self.db_client = get_db_client()
+        self._count_cache = TTLCache(maxsize=MEETINGS_COUNT_CACHE_SIZE, ttl=settings.MEETINGS_COUNT_CACHE_TTL) \
+            if settings.MEETINGS_COUNT_CACHE_TTL > 0 else None
+        self._count_cache_lock = threading.Lock()
     
     def get_processing_status(self, meeting_id: str) -> Tuple[Dict[str, Any], int]:
         """
@@ -53,8 +127,8 @@ class MeetingService:
             Tuple[Dict[str, Any], int]: Response data and HTTP status code
         """
         try:
-            # Get meeting details
-            meeting = self._get_meeting_by_id(meeting_id)
+            # Get meeting status fields
+            meeting = self._get_meeting_summary_by_id(meeting_id)
             
             if not meeting:
                 return jsonify({'error': 'Meeting not found'}), 404
@@ -67,40 +141,55 @@ class MeetingService:
             }), 200
             
         except Exception as e:
-            logger.error(f"Get processing status error: {str(e)}")
+            logger.error("Get processing status error: %s", e)
             return jsonify({'error': 'Failed to get processing status'}), 500
     
-    def get_meetings(self, organization_id: str, limit: int = 10, offset: int = 0) -> Tuple[Dict[str, Any], int]:
+    def get_meetings(self, organization_id: str, limit: int = 10, offset: int = 0, cursor: Optional[str] = None) -> Tuple[Dict[str, Any], int]:
         """
-        Get all meetings for an organization
+        Get all meetings for an organization, newest first
+        
+        Pass the previous response's next_cursor to page with a keyset seek
+        (cost independent of page depth); offset is kept for older clients.
         
         Args:
             organization_id: Organization ID
             limit: Number of meetings to return
-            offset: Number of meetings to skip
+            offset: Number of meetings to skip (ignored when cursor is given)
+            cursor: Keyset cursor from a previous page (optional)
             
         Returns:
             Tuple[Dict[str, Any], int]: Response data and HTTP status code
         """
         try:
-            meetings = self._get_meetings_by_organization(organization_id, limit, offset)
-            total = self._get_meetings_count(organization_id)
+            after = None
+            if cursor:
+                try:
+                    after = decode_cursor(cursor)
+                except ValueError as e:
+                    return jsonify({'error': str(e)}), 400
+            
+            meetings, has_more = self._get_meetings_by_organization(organization_id, limit, offset, after)
+            total = self._get_cached_count(organization_id)
             
             return jsonify({
                 'meetings': meetings,
                 'total': total,
                 'limit': limit,
-                'offset': offset
+                'offset': offset,
+                'next_cursor': encode_cursor(meetings[-1]) if has_more else None
             }), 200
             
         except Exception as e:
-            logger.error(f"Get meetings error: {str(e)}")
+            logger.error("Get meetings error: %s", e)
             return jsonify({'error': 'Failed to get meetings'}), 500
     
     def get_meetings_with_transcripts(self, organization_id: str = None, limit: int = 100, offset: int = 0) -> Tuple[Dict[str, Any], int]:
         """
         Get meetings that have completed transcripts, optionally filtered by organization.
 
+        Each meeting carries a transcript preview and its length; the full text
+        is served by get_meeting_transcript.
+
         Args:
             organization_id: Organization ID (optional)
             limit: Number of meetings to return
@@ -110,63 +199,34 @@ class MeetingService:
             Tuple[Dict[str, Any], int]: Response data and HTTP status code
         """
         try:
-            # First get meeting IDs that have transcripts in meeting_minutes table
-            minutes_query = self.db_client.table('meeting_minutes') \
-                .select('meeting_id,transcript,summary,created_at') \
-                .not_.is_('transcript', 'null') \
-                .neq('transcript', '') \
-                .order('created_at', desc=True)
-            
-            minutes_response = minutes_query.execute()
-            
-            if not minutes_response.data:
-                return jsonify({
-                    'meetings': [],
-                    'total': 0,
-                    'limit': limit,
-                    'offset': offset
-                }), 200
-            
-            # Get unique meeting IDs that have transcripts
-            meeting_ids = list(set([m['meeting_id'] for m in minutes_response.data if m.get('meeting_id')]))
-            
-            if not meeting_ids:
-                return jsonify({
-                    'meetings': [],
-                    'total': 0,
-                    'limit': limit,
-                    'offset': offset
-                }), 200
-            
-            # Now get meeting details for these IDs
+            # Single round trip: inner-join the latest transcript per meeting
+            # server-side, paginate and count in the same request
             meetings_query = self.db_client.table('meetings') \
-                .select('id,title,created_at,organization_id') \
-                .in_('id', meeting_ids) \
+                .select('id,title,created_at,organization_id,meeting_minutes!inner(transcript,summary,created_at)', count='exact') \
+                .not_.is_('meeting_minutes.transcript', 'null') \
+                .neq('meeting_minutes.transcript', '') \
+                .order('created_at', desc=True, foreign_table='meeting_minutes') \
+                .limit(1, foreign_table='meeting_minutes') \
                 .order('created_at', desc=True)
             
             if organization_id:
                 meetings_query = meetings_query.eq('organization_id', organization_id)
             
             if limit is not None and offset is not None:
-                meetings_query = meetings_query.range(offset, offset + limit - 1)
+                meetings_query = meetings_query.limit(limit).offset(offset)
             
             meetings_response = meetings_query.execute()
+            total = meetings_response.count or 0
             
-            # Get total count for pagination
-            count_query = self.db_client.table('meetings') \
-                .select('count', count='exact') \
-                .in_('id', meeting_ids)
-            if organization_id:
-                count_query = count_query.eq('organization_id', organization_id)
-            total = count_query.execute().count or 0
-            
-            # Combine meeting data with transcript info
+            # Flatten the embedded transcript into the meeting
             meetings = []
             for meeting in (meetings_response.data or []):
-                # Find corresponding transcript
-                transcript_data = next((m for m in minutes_response.data if m['meeting_id'] == meeting['id']), None)
-                if transcript_data:
-                    meeting['transcript'] = transcript_data.get('transcript', '')
+                minutes = meeting.pop('meeting_minutes', None) or []
+                if minutes:
+                    transcript_data = minutes[0]
+                    transcript = transcript_data.get('transcript') or ''
+                    meeting['transcript_preview'] = transcript[:TRANSCRIPT_PREVIEW_LENGTH]
+                    meeting['transcript_length'] = len(transcript)
                     meeting['summary'] = transcript_data.get('summary', '')
                     meeting['transcript_created_at'] = transcript_data.get('created_at', '')
                     meetings.append(meeting)
@@ -179,7 +239,7 @@ class MeetingService:
             }), 200
 
         except Exception as e:
-            logger.error(f"Get meetings with transcripts error: {str(e)}")
+            logger.error("Get meetings with transcripts error: %s", e)
             return jsonify({'error': 'Failed to get meetings with transcripts'}), 500
 
     def get_transcribed_meeting_options(self, organization_id: str = None, limit: int = 100, offset: int = 0) -> Tuple[Dict[str, Any], int]:
@@ -195,69 +255,68 @@ class MeetingService:
             Tuple[Dict[str, Any], int]: Response data and HTTP status code
         """
         try:
-            # First get meeting IDs that have transcripts in meeting_minutes table
-            minutes_query = self.db_client.table('meeting_minutes') \
-                .select('meeting_id,transcript') \
-                .not_.is_('transcript', 'null') \
-                .neq('transcript', '') \
-                .order('created_at', desc=True)
-            
-            minutes_response = minutes_query.execute()
-            
-            if not minutes_response.data:
-                return jsonify({
-                    'options': [],
-                    'total': 0,
-                    'limit': limit,
-                    'offset': offset
-                }), 200
+            if settings.TRANSCRIBED_OPTIONS_VIEW_ENABLED:
+                return self._get_transcribed_meeting_options_from_view(organization_id, limit, offset)
             
-            # Get unique meeting IDs that have transcripts
-            meeting_ids = list(set([m['meeting_id'] for m in minutes_response.data if m.get('meeting_id')]))
-            
-            if not meeting_ids:
-                return jsonify({
-                    'options': [],
-                    'total': 0,
-                    'limit': limit,
-                    'offset': offset
-                }), 200
-            
-            # Now get meeting details for these IDs
+            # Filter, order and paginate server-side: only meetings with a
+            # non-empty transcript in the requested window are returned
             meetings_query = self.db_client.table('meetings') \
-                .select('id,title,created_at,organization_id') \
-                .in_('id', meeting_ids) \
+                .select('id,title,created_at,organization_id,meeting_minutes!inner(meeting_id)', count='exact') \
+                .not_.is_('meeting_minutes.transcript', 'null') \
+                .neq('meeting_minutes.transcript', '') \
+                .limit(1, foreign_table='meeting_minutes') \
                 .order('created_at', desc=True)
             
             if organization_id:
                 meetings_query = meetings_query.eq('organization_id', organization_id)
             
             if limit is not None and offset is not None:
-                meetings_query = meetings_query.range(offset, offset + limit - 1)
+                meetings_query = meetings_query.limit(limit).offset(offset)
             
             meetings_response = meetings_query.execute()
             
             # Create dropdown options
-            options = []
-            for meeting in (meetings_response.data or []):
-                title = meeting.get('title') or f"Meeting {meeting['id'][:8]}"
-                options.append({
-                    'value': meeting['id'], 
-                    'label': title,
+            options = [
+                {
+                    'value': meeting['id'],
+                    'label': meeting.get('title') or f"Meeting {meeting['id'][:8]}",
                     'organization_id': meeting.get('organization_id')
-                })
+                }
+                for meeting in (meetings_response.data or [])
+            ]
             
             return jsonify({
                 'options': options,
-                'total': len(options),
+                'total': meetings_response.count or 0,
                 'limit': limit,
                 'offset': offset
             }), 200
 
         except Exception as e:
-            logger.error(f"Get transcribed meeting options error: {str(e)}")
+            logger.error("Get transcribed meeting options error: %s", e)
             return jsonify({'error': 'Failed to get transcribed meeting options'}), 500
 
+    def _get_transcribed_meeting_options_from_view(self, organization_id: str, limit: int, offset: int) -> Tuple[Dict[str, Any], int]:
+        """Get dropdown options from the precomputed transcribed_meeting_options view"""
+        options_query = self.db_client.table('transcribed_meeting_options') \
+            .select('value,label,organization_id', count='exact') \
+            .order('created_at', desc=True)
+        
+        if organization_id:
+            options_query = options_query.eq('organization_id', organization_id)
+        
+        if limit is not None and offset is not None:
+            options_query = options_query.limit(limit).offset(offset)
+        
+        options_response = options_query.execute()
+        
+        return jsonify({
+            'options': options_response.data or [],
+            'total': options_response.count or 0,
+            'limit': limit,
+            'offset': offset
+        }), 200
+
     def get_organization_options(self) -> Tuple[Dict[str, Any], int]:
         """
         Get compact organization options for dropdowns: [{ value, label }]
@@ -279,32 +338,25 @@ class MeetingService:
                 }), 200
             
             # Get unique organization IDs, filtering out empty strings and None values
-            org_ids = list(set([
+            org_ids = list(dict.fromkeys(
                 m['organization_id'] for m in response.data 
                 if m.get('organization_id') and m['organization_id'].strip() != ''
-            ]))
+            ))
             
-            # Create dropdown options
-            options = []
-            for org_id in org_ids:
-                # Get organization name if available, otherwise use ID
+            # Look up organization names with one IN query per chunk of IDs
+            names = {}
+            for start in range(0, len(org_ids), ORGANIZATION_LOOKUP_CHUNK):
                 org_response = self.db_client.table('organizations') \
-                    .select('name') \
-                    .eq('id', org_id) \
+                    .select('id,name') \
+                    .in_('id', org_ids[start:start + ORGANIZATION_LOOKUP_CHUNK]) \
                     .execute()
-                
-                if org_response.data and org_response.data[0].get('name'):
-                    label = org_response.data[0]['name']
-                else:
-                    label = f"Organization {org_id[:8]}..."
-                
-                options.append({
-                    'value': org_id,
-                    'label': label
-                })
-            
-            # Sort by label
-            options.sort(key=lambda x: x['label'])
+                names.update((str(org['id']), org['name']) for org in (org_response.data or []) if org.get('name'))
+            
+            # Create dropdown options sorted by label, falling back to the ID when there is no name
+            options = sorted(
+                ({'value': org_id, 'label': names.get(org_id) or f"Organization {org_id[:8]}..."} for org_id in org_ids),
+                key=itemgetter('label')
+            )
             
             return jsonify({
                 'options': options,
@@ -312,7 +364,7 @@ class MeetingService:
             }), 200
 
         except Exception as e:
-            logger.error(f"Get organization options error: {str(e)}")
+            logger.error("Get organization options error: %s", e)
             return jsonify({'error': 'Failed to get organization options'}), 500
 
     def get_meeting(self, meeting_id: str) -> Tuple[Dict[str, Any], int]:
@@ -331,45 +383,117 @@ class MeetingService:
             if not meeting:
                 return jsonify({'error': 'Meeting not found'}), 404
             
-            # Get related data
-            blog_posts = self._get_blog_posts_by_meeting(meeting_id)
-            processing_logs = self._get_processing_logs_by_meeting(meeting_id)
+            # Blog posts and logs are independent of each other, so load them in parallel
+            blog_posts_future = _related_query_executor.submit(self._get_blog_posts_by_meeting, meeting_id)
+            processing_logs_future = _related_query_executor.submit(self._get_processing_logs_by_meeting, meeting_id)
             
             meeting_data = {
                 'meeting': meeting,
-                'blog_posts': blog_posts,
-                'processing_logs': processing_logs
+                'blog_posts': blog_posts_future.result(),
+                'processing_logs': processing_logs_future.result()
             }
             
             return jsonify(meeting_data), 200
             
         except Exception as e:
-            logger.error(f"Get meeting error: {str(e)}")
+            logger.error("Get meeting error: %s", e)
             return jsonify({'error': 'Failed to get meeting'}), 500
     
+    def get_meeting_transcript(self, meeting_id: str) -> Tuple[Dict[str, Any], int]:
+        """
+        Get the latest full transcript of a meeting
+        
+        Args:
+            meeting_id: Meeting ID
+            
+        Returns:
+            Tuple[Dict[str, Any], int]: Response data and HTTP status code
+        """
+        try:
+            response = self.db_client.table('meeting_minutes') \
+                .select('transcript,summary,created_at') \
+                .eq('meeting_id', meeting_id) \
+                .not_.is_('transcript', 'null') \
+                .neq('transcript', '') \
+                .order('created_at', desc=True) \
+                .limit(1) \
+                .execute()
+            
+            if not response.data:
+                return jsonify({'error': 'Transcript not found'}), 404
+            
+            minutes = response.data[0]
+            return jsonify({
+                'meeting_id': meeting_id,
+                'transcript': minutes['transcript'],
+                'summary': minutes.get('summary', ''),
+                'transcript_created_at': minutes.get('created_at', '')
+            }), 200
+            
+        except Exception as e:
+            logger.error("Get meeting transcript error: %s", e)
+            return jsonify({'error': 'Failed to get meeting transcript'}), 500
+    
     def _get_meeting_by_id(self, meeting_id: str) -> Dict[str, Any]:
         """Get meeting by ID from database"""
         try:
+            if settings.MEETING_LOADER_ENABLED:
+                # Coalesce with concurrent lookups into a single IN (...) query
+                return meeting_loader.load_sync(meeting_id)
+            
             response = self.db_client.table('meetings').select('*').eq('id', meeting_id).execute()
             if response.data:
                 return response.data[0]
             return None
         except Exception as e:
-            logger.error(f"Error getting meeting by ID: {str(e)}")
+            logger.error("Error getting meeting by ID: %s", e)
             raise
     
-    def _get_meetings_by_organization(self, organization_id: str, limit: int, offset: int) -> List[Dict[str, Any]]:
-        """Get meetings by organization with pagination"""
+    def _get_meeting_summary_by_id(self, meeting_id: str) -> Dict[str, Any]:
+        """Get only the status fields of a meeting by ID"""
         try:
-            response = self.db_client.table('meetings')\
-                .select('*')\
-                .eq('organization_id', organization_id)\
-                .order('created_at', desc=True)\
-                .range(offset, offset + limit - 1)\
-                .execute()
-            return response.data or []
+            response = self.db_client.table('meetings').select(MEETING_STATUS_COLUMNS).eq('id', meeting_id).execute()
+            if response.data:
+                return response.data[0]
+            return None
         except Exception as e:
-            logger.error(f"Error getting meetings by organization: {str(e)}")
+            logger.error("Error getting meeting summary by ID: %s", e)
+            raise
+    
+    def _get_meetings_by_organization(self, organization_id: str, limit: int, offset: int = 0,
+                                      after: Optional[Tuple[str, str]] = None) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Get meetings by organization with pagination
+        
+        Rows are ordered by (created_at, id) descending so the order is total.
+        With `after`, the page starts right after that row using a keyset seek
+        on idx_meetings_org_created_at_id (see scripts/add-pagination-indexes.sql)
+        instead of OFFSET. One extra row is fetched to tell whether another
+        page follows.
+        
+        Returns:
+            Tuple[List[Dict[str, Any]], bool]: Up to `limit` meetings and whether more exist
+        """
+        try:
+            query = self.db_client.table('meetings')\
+                .select(MEETING_LIST_COLUMNS)\
+                .eq('organization_id', organization_id)
+            # One order param with both keys (repeated order params are not combined)
+            query.params = query.params.add('order', 'created_at.desc,id.desc')
+            
+            if after:
+                created_at, meeting_id = after
+                query.params = query.params.add(
+                    'or', f'(created_at.lt."{created_at}",and(created_at.eq."{created_at}",id.lt.{meeting_id}))'
+                )
+                query = query.limit(limit + 1)
+            else:
+                query = query.limit(limit + 1).offset(offset)
+            
+            rows = query.execute().data or []
+            return rows[:limit], len(rows) > limit
+        except Exception as e:
+            logger.error("Error getting meetings by organization: %s", e)
             raise
     
     def _get_meetings_count(self, organization_id: str) -> int:
@@ -381,9 +505,22 @@ class MeetingService:
                 .execute()
             return response.count or 0
         except Exception as e:
-            logger.error(f"Error getting meetings count: {str(e)}")
+            logger.error("Error getting meetings count: %s", e)
             raise
     
+    def _get_cached_count(self, organization_id: str) -> int:
+        """Get the meetings count for an organization, reusing it for settings.MEETINGS_COUNT_CACHE_TTL seconds"""
+        if self._count_cache is None:
+            return self._get_meetings_count(organization_id)
+        
+        with self._count_cache_lock:
+            total = self._count_cache.get(organization_id)
+        if total is None:
+            total = self._get_meetings_count(organization_id)
+            with self._count_cache_lock:
+                self._count_cache[organization_id] = total
+        return total
+    
 
     
     def _get_blog_posts_by_meeting(self, meeting_id: str) -> List[Dict[str, Any]]:
@@ -395,7 +532,7 @@ class MeetingService:
                 .execute()
             return response.data or []
         except Exception as e:
-            logger.error(f"Error getting blog posts by meeting: {str(e)}")
+            logger.error("Error getting blog posts by meeting: %s", e)
             raise
     
     def _get_processing_logs_by_meeting(self, meeting_id: str) -> List[Dict[str, Any]]:
@@ -404,9 +541,9 @@ class MeetingService:
             response = self.db_client.table('processing_logs')\
                 .select('*')\
                 .eq('meeting_id', meeting_id)\
-                .order('created_at', desc=True)\
+                .order('started_at', desc=True)\
                 .execute()
             return response.data or []
         except Exception as e:
-            logger.error(f"Error getting processing logs by meeting: {str(e)}")
+            logger.error("Error getting processing logs by meeting: %s", e)
             raise 
\ No newline at end of file
@@ -0,0 +1,186 @@
+"""
+Retry helpers for Blog Automation System
+
+This module handles retrying operations that fail for transient reasons
+including:
+- Connection pool exhaustion and connect/read failures
+- Gateway errors (502/503/504) returned while Supabase restarts
+- Rebuilding pooled connections after repeated failures
+- Jittered backoff delays and a circuit breaker for outbound webhooks
+
+Input Types:
+- fn: Callable - Zero-argument function that builds and executes the query
+- max_retries: Integer - Number of retries after the first attempt
+- base: Float - Base delay in seconds for exponential backoff
+- max_delay: Float - Upper bound for a single delay in seconds
+
+Output Types:
+- result: Any - Return value of fn
+
+Author: Your Name
+Date: 2024
+"""
+
+import logging
+import random
+import time
+from typing import Any, Callable, Optional
+
+import httpx
+from postgrest import APIError
+
+logger = logging.getLogger(__name__)
+
+# Network errors that are worth retrying on a fresh connection
+TRANSIENT_HTTP_ERRORS = (
+    httpx.PoolTimeout,
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.ReadError,
+    httpx.RemoteProtocolError,
+)
+
+# Upstream status codes returned while the API gateway or database restarts
+TRANSIENT_STATUS_CODES = frozenset({502, 503, 504})
+
+# Consecutive failures after which the connection pool is rebuilt
+RECONNECT_AFTER_FAILURES = 2
+
+# Webhook responses worth retrying: rate limiting and gateway errors. A plain
+# 500 is not retried because the receiver may already have acted on the call.
+RETRYABLE_WEBHOOK_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+def is_connection_error(error: Exception) -> bool:
+    """
+    Check whether an error is transient and the operation may be retried
+
+    Args:
+        error: Exception raised by the database operation
+
+    Returns:
+        bool: True if the error is transient, False if it is permanent
+    """
+    if isinstance(error, TRANSIENT_HTTP_ERRORS):
+        return True
+
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in TRANSIENT_STATUS_CODES
+
+    if isinstance(error, APIError):
+        try:
+            return int(error.code) in TRANSIENT_STATUS_CODES
+        except (TypeError, ValueError):
+            return False
+
+    return False
+
+
+def retry_db_operation(fn: Callable[[], Any], *, max_retries: int = 6, base: float = 0.1,
+                       max_delay: float = 10, on_reconnect: Optional[Callable[[], None]] = None) -> Any:
+    """
+    Execute a database operation, retrying transient failures with jittered backoff
+
+    The callable must build its query from scratch on every call so that a
+    retry after a reconnect uses the new connection pool.
+
+    Args:
+        fn: Zero-argument function that builds and executes the query
+        max_retries: Number of retries after the first attempt
+        base: Base delay in seconds for exponential backoff
+        max_delay: Upper bound for a single delay in seconds
+        on_reconnect: Called to rebuild connections after repeated failures
+
+    Returns:
+        Any: Return value of fn
+
+    Raises:
+        Exception: The last error if it is permanent or retries are exhausted
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return fn()
+        except Exception as e:
+            if attempt == max_retries or not is_connection_error(e):
+                raise
+
+            delay = min(max_delay, random.uniform(0, base * 2 ** attempt))
+            logger.warning(
+                "Transient database error (attempt %d/%d), retrying in %.2fs: %s",
+                attempt + 1, max_retries + 1, delay, e
+            )
+
+            if on_reconnect is not None and attempt + 1 >= RECONNECT_AFTER_FAILURES:
+                on_reconnect()
+
+            time.sleep(delay)
+
+
+def backoff_delay(attempt: int, base: float, max_delay: float, retry_after: Optional[str] = None) -> float:
+    """
+    Get the delay before the next retry using exponential backoff with full jitter
+
+    Args:
+        attempt: Zero-based number of the attempt that just failed
+        base: Base delay in seconds
+        max_delay: Upper bound for the delay in seconds
+        retry_after: Retry-After header from the response, if any
+
+    Returns:
+        float: Delay in seconds
+    """
+    if retry_after:
+        try:
+            return min(max_delay, max(0.0, float(retry_after)))
+        except ValueError:
+            pass  # HTTP-date form; fall back to backoff
+
+    return random.uniform(0, min(max_delay, base * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """
+    Stop calling an endpoint after repeated failures
+
+    CLOSED: calls go through. After `failure_threshold` consecutive failures the
+    breaker is OPEN and calls are refused for `cooldown` seconds. Then it is
+    HALF-OPEN: one trial call goes through, and its outcome closes or reopens it.
+
+    Not thread-safe; use it from a single event loop.
+    """
+
+    def __init__(self, failure_threshold: int, cooldown: float):
+        """
+        Initialize circuit breaker
+
+        Args:
+            failure_threshold: Consecutive failures that open the breaker
+            cooldown: Seconds to refuse calls once open
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    def allow(self) -> bool:
+        """Check whether a call may be made now"""
+        if self._opened_at is None:
+            return True
+        if time.monotonic() - self._opened_at < self.cooldown or self._trial_in_flight:
+            return False
+        self._trial_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        """Record that the endpoint answered; closes the breaker"""
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed call; opens the breaker at the threshold or after a failed trial"""
+        self._failures += 1
+        self._trial_in_flight = False
+        if self._opened_at is not None or self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
@@ -24,10 +24,18 @@ Date: 2024
 
 import re
 import logging
+import uuid
 from typing import Dict, Any, Tuple, Optional
 
 logger = logging.getLogger(__name__)
 
+# Patterns compiled once at import
+_DANGEROUS_CHARS_RE = re.compile(r'[<>"\']')
+_DANGEROUS_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_URL_RE = re.compile(r'^https?://[^\s/$.?#].[^\s]*$')
+_ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d{3})?Z?$')
+
 class ValidationService:
     """Service class for input validation and sanitization"""
     
@@ -69,7 +77,7 @@ class ValidationService:
             return True, None
             
         except Exception as e:
-            logger.error(f"Error validating meeting data: {str(e)}")
+            logger.error("Error validating meeting data: %s", e)
             return False, "Validation error occurred"
     
     def validate_webhook_data(self, data: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
@@ -113,7 +121,7 @@ class ValidationService:
             return True, None
             
         except Exception as e:
-            logger.error(f"Error validating webhook data: {str(e)}")
+            logger.error("Error validating webhook data: %s", e)
             return False, "Validation error occurred"
     
     def sanitize_string(self, value: str, max_length: int = None) -> str:
@@ -134,7 +142,7 @@ class ValidationService:
         sanitized = value.strip()
         
         # Remove potentially dangerous characters
-        sanitized = re.sub(r'[<>"\']', '', sanitized)
+        sanitized = _DANGEROUS_CHARS_RE.sub('', sanitized)
         
         # Truncate if too long
         if max_length and len(sanitized) > max_length:
@@ -156,7 +164,7 @@ class ValidationService:
             return ""
         
         # Remove path separators and other dangerous characters
-        sanitized = re.sub(r'[<>:"/\\|?*]', '', filename)
+        sanitized = _DANGEROUS_FILENAME_CHARS_RE.sub('', filename)
         
         # Remove leading/trailing dots and spaces
         sanitized = sanitized.strip('. ')
@@ -181,9 +189,7 @@ class ValidationService:
         if not email:
             return False
         
-        # Basic email regex pattern
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+        return bool(_EMAIL_RE.match(email))
     
     def validate_url(self, url: str) -> bool:
         """
@@ -198,9 +204,7 @@ class ValidationService:
         if not url:
             return False
         
-        # Basic URL regex pattern
-        pattern = r'^https?://[^\s/$.?#].[^\s]*$'
-        return bool(re.match(pattern, url))
+        return bool(_URL_RE.match(url))
     
     def _is_valid_uuid(self, uuid_string: str) -> bool:
         """
@@ -215,9 +219,12 @@ class ValidationService:
         if not uuid_string:
             return False
         
-        # UUID regex pattern
-        pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
-        return bool(re.match(pattern, uuid_string.lower()))
+        try:
+            # uuid.UUID also accepts braces, "urn:uuid:" and unhyphenated input;
+            # only the canonical 8-4-4-4-12 form is valid here
+            return str(uuid.UUID(uuid_string)) == uuid_string.lower()
+        except (ValueError, TypeError, AttributeError):
+            return False
     
     def _is_valid_date_format(self, date_string: str) -> bool:
         """
@@ -232,6 +239,4 @@ class ValidationService:
         if not date_string:
             return False
         
-        # ISO 8601 date regex pattern
-        pattern = r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d{3})?Z?$'
-        return bool(re.match(pattern, date_string)) 
\ No newline at end of file
+        return bool(_ISO_DATE_RE.match(date_string)) 
\ No newline at end of file
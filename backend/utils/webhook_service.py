@@ -6,6 +6,7 @@ This module handles all webhook callbacks from Make.com including:
 - Blog generation completion
 - Facebook posting completion
 - Error handling
+- Optional queued processing (202 Accepted)
 
 Input Types:
 - meeting_id: String (required)
@@ -24,20 +25,46 @@ Date: 2024
 
 from flask import request, jsonify
 import logging
-import asyncio
-from typing import Dict, Any, Tuple
+import os
+import queue
+import threading
+from typing import Dict, Any, Tuple, Optional
 from datetime import datetime
 
 from db import get_db_client
+from utils.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Fields every webhook must carry
+REQUIRED_FIELDS = ('meeting_id', 'step')
+
+# Steps handled by WebhookService
+_STEP_NAMES = (
+    'transcription_complete',
+    'blog_generation_complete',
+    'facebook_post_complete',
+    'instagram_post_complete',
+    'processing_error'
+)
+VALID_STEPS = frozenset(_STEP_NAMES)
+_VALID_STEPS_LIST = ', '.join(_STEP_NAMES)
+
+# Steps whose data must include a source
+STEPS_REQUIRING_SOURCE = frozenset({'transcription_complete', 'processing_error'})
+
+
 class WebhookService:
     """Service class for handling webhook callbacks"""
     
     def __init__(self):
         """Initialize webhook service"""
         self.db_client = get_db_client()
+        self._queue: Optional[queue.Queue] = queue.Queue(maxsize=settings.WEBHOOK_QUEUE_SIZE) \
+            if settings.WEBHOOK_ASYNC_ENABLED else None
+        self._worker: Optional[threading.Thread] = None
+        self._worker_pid: Optional[int] = None
+        self._worker_lock = threading.Lock()
     
     def handle_webhook(self, request_obj: request) -> Tuple[Dict[str, Any], int]:
         """
@@ -65,41 +92,16 @@ class WebhookService:
             if not validation_result['is_valid']:
                 return jsonify({'error': validation_result['error']}), 400
             
-            # Extract fields
-            meeting_id = webhook_data.get('meeting_id')
-            step = webhook_data.get('step')
-            data = webhook_data.get('data', {})
-            status = webhook_data.get('status')
-            error = webhook_data.get('error')
-            
-            logger.info(f"Webhook received: {step} for meeting {meeting_id}")
+            logger.info("Webhook received: %s for meeting %s", webhook_data.get('step'), webhook_data.get('meeting_id'))
             
-            # Process webhook based on step
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            if self._queue is not None and self._enqueue(webhook_data):
+                return jsonify({
+                    'success': True,
+                    'message': 'Webhook accepted for processing'
+                }), 202
             
-            try:
-                if step == 'transcription_complete':
-                    loop.run_until_complete(self._handle_transcription_complete(meeting_id, data))
-                    
-                elif step == 'blog_generation_complete':
-                    loop.run_until_complete(self._handle_blog_generation_complete(meeting_id, data))
-                    
-                elif step == 'facebook_post_complete':
-                    loop.run_until_complete(self._handle_facebook_post_complete(meeting_id, data))
-                    
-                elif step == 'instagram_post_complete':
-                    loop.run_until_complete(self._handle_instagram_post_complete(meeting_id, data))
-                    
-                elif step == 'processing_error':
-                    loop.run_until_complete(self._handle_processing_error(meeting_id, error))
-                    
-                else:
-                    logger.warning(f"Unknown webhook step: {step}")
-                    return jsonify({'error': 'Unknown step'}), 400
-                    
-            finally:
-                loop.close()
+            if not self._process_webhook(webhook_data):
+                return jsonify({'error': 'Unknown step'}), 400
             
             return jsonify({
                 'success': True,
@@ -107,9 +109,92 @@ class WebhookService:
             }), 200
             
         except Exception as e:
-            logger.error(f"Webhook processing error: {str(e)}")
+            logger.error("Webhook processing error: %s", e)
             return jsonify({'error': 'Webhook processing failed'}), 500
     
+    def _process_webhook(self, webhook_data: Dict[str, Any]) -> bool:
+        """
+        Run the handler for a validated webhook
+        
+        Args:
+            webhook_data: Validated webhook data
+            
+        Returns:
+            bool: False if the step has no handler
+            
+        Raises:
+            Exception: If the handler fails
+        """
+        # Extract fields
+        meeting_id = webhook_data.get('meeting_id')
+        step = webhook_data.get('step')
+        data = webhook_data.get('data', {})
+        error = webhook_data.get('error')
+        
+        # Process webhook based on step
+        if step == 'transcription_complete':
+            self._handle_transcription_complete(meeting_id, data)
+            
+        elif step == 'blog_generation_complete':
+            self._handle_blog_generation_complete(meeting_id, data)
+            
+        elif step == 'facebook_post_complete':
+            self._handle_facebook_post_complete(meeting_id, data)
+            
+        elif step == 'instagram_post_complete':
+            self._handle_instagram_post_complete(meeting_id, data)
+            
+        elif step == 'processing_error':
+            self._handle_processing_error(meeting_id, error)
+            
+        else:
+            logger.warning("Unknown webhook step: %s", step)
+            return False
+        
+        return True
+    
+    def _enqueue(self, webhook_data: Dict[str, Any]) -> bool:
+        """
+        Queue a validated webhook for the background worker
+        
+        Args:
+            webhook_data: Validated webhook data
+            
+        Returns:
+            bool: False if the queue is full and the caller should process it inline
+        """
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(webhook_data)
+            return True
+        except queue.Full:
+            logger.warning("Webhook queue full (%d); processing in request", settings.WEBHOOK_QUEUE_SIZE)
+            return False
+    
+    def _ensure_worker(self) -> None:
+        """Start the queue worker thread in this process if it is not running"""
+        with self._worker_lock:
+            if self._worker is not None and self._worker_pid == os.getpid() and self._worker.is_alive():
+                return
+            
+            self._worker = threading.Thread(target=self._run_worker, name='webhook-worker', daemon=True)
+            self._worker.start()
+            self._worker_pid = os.getpid()
+    
+    def _run_worker(self) -> None:
+        """Process queued webhooks one at a time, in arrival order"""
+        while True:
+            webhook_data = self._queue.get()
+            try:
+                self._process_webhook(webhook_data)
+            except Exception as e:
+                logger.error(
+                    "Queued webhook %s for meeting %s failed: %s",
+                    webhook_data.get('step'), webhook_data.get('meeting_id'), e
+                )
+            finally:
+                self._queue.task_done()
+    
     def _validate_webhook_data(self, webhook_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validate webhook data
@@ -121,9 +206,7 @@ class WebhookService:
             Dict[str, Any]: Validation result with 'is_valid' and 'error' keys
         """
         # Check required fields
-        required_fields = ['meeting_id', 'step']
-        
-        for field in required_fields:
+        for field in REQUIRED_FIELDS:
             if field not in webhook_data or not webhook_data[field]:
                 return {
                     'is_valid': False,
@@ -131,22 +214,15 @@ class WebhookService:
                 }
         
         # Validate step values
-        valid_steps = [
-            'transcription_complete',
-            'blog_generation_complete',
-            'facebook_post_complete',
-            'instagram_post_complete',
-            'processing_error'
-        ]
-        
-        if webhook_data['step'] not in valid_steps:
+        # Non-string steps (e.g. a JSON list) are unhashable and never valid
+        if not isinstance(webhook_data['step'], str) or webhook_data['step'] not in VALID_STEPS:
             return {
                 'is_valid': False,
-                'error': f'Invalid step: {webhook_data["step"]}. Valid steps: {", ".join(valid_steps)}'
+                'error': f'Invalid step: {webhook_data["step"]}. Valid steps: {_VALID_STEPS_LIST}'
             }
         
         # Check for source in data for meeting ID flow
-        if webhook_data['step'] in ['transcription_complete', 'processing_error']:
+        if webhook_data['step'] in STEPS_REQUIRING_SOURCE:
             if 'source' not in webhook_data.get('data', {}):
                 return {
                     'is_valid': False,
@@ -155,7 +231,7 @@ class WebhookService:
         
         return {'is_valid': True}
     
-    async def _handle_transcription_complete(self, meeting_id: str, data: Dict[str, Any] = None) -> None:
+    def _handle_transcription_complete(self, meeting_id: str, data: Dict[str, Any] = None) -> None:
         """
         Handle transcription completion
         
@@ -170,10 +246,10 @@ class WebhookService:
             source = data.get('source', 'meeting_id')
             
             # Update meeting with transcript and summary
-            await self._update_meeting_transcript(meeting_id, transcript, summary)
+            self._update_meeting_transcript(meeting_id, transcript, summary)
             
             # Log processing step
-            await self._log_processing_step(
+            self._log_processing_step(
                 meeting_id,
                 'transcription',
                 'completed',
@@ -184,13 +260,13 @@ class WebhookService:
                 }
             )
             
-            logger.info(f"Transcription completed for meeting: {meeting_id} (source: {source})")
+            logger.info("Transcription completed for meeting: %s (source: %s)", meeting_id, source)
             
         except Exception as e:
-            logger.error(f"Error handling transcription complete: {str(e)}")
+            logger.error("Error handling transcription complete: %s", e)
             raise
     
-    async def _handle_blog_generation_complete(self, meeting_id: str, data: Dict[str, Any]) -> None:
+    def _handle_blog_generation_complete(self, meeting_id: str, data: Dict[str, Any]) -> None:
         """
         Handle blog generation completion
         
@@ -210,11 +286,11 @@ class WebhookService:
                 blog_data['id'] = data.get('blog_id')
             
             # Store blog post
-            blog_post = await self._store_blog_post(blog_data)
+            blog_post = self._store_blog_post(blog_data)
             
             # Store generated image/poster if provided
             if data.get('image_url') or data.get('poster_url'):
-                await self._store_generated_image(
+                self._store_generated_image(
                     meeting_id, 
                     blog_post['id'], 
                     data.get('image_url') or data.get('poster_url'),
@@ -223,7 +299,7 @@ class WebhookService:
                 )
             
             # Log processing step
-            await self._log_processing_step(
+            self._log_processing_step(
                 meeting_id,
                 'blog_generation',
                 'completed',
@@ -234,13 +310,13 @@ class WebhookService:
                 }
             )
             
-            logger.info(f"Blog generation completed for meeting: {meeting_id}")
+            logger.info("Blog generation completed for meeting: %s", meeting_id)
             
         except Exception as e:
-            logger.error(f"Error handling blog generation complete: {str(e)}")
+            logger.error("Error handling blog generation complete: %s", e)
             raise
     
-    async def _handle_facebook_post_complete(self, meeting_id: str, data: Dict[str, Any]) -> None:
+    def _handle_facebook_post_complete(self, meeting_id: str, data: Dict[str, Any]) -> None:
         """
         Handle Facebook post completion
         
@@ -255,7 +331,7 @@ class WebhookService:
             image_url = data.get('image_url')
             
             # Update blog post with Facebook details
-            await self._update_blog_post_facebook(
+            self._update_blog_post_facebook(
                 blog_id,
                 facebook_post_id,
                 facebook_post_url
@@ -263,10 +339,10 @@ class WebhookService:
             
             # Update poster/image with Facebook posting info if image was used
             if image_url:
-                await self._update_poster_facebook_status(meeting_id, blog_id, image_url)
+                self._update_poster_facebook_status(meeting_id, blog_id, image_url)
             
             # Log processing step
-            await self._log_processing_step(
+            self._log_processing_step(
                 meeting_id,
                 'facebook_post',
                 'completed',
@@ -278,13 +354,13 @@ class WebhookService:
                 }
             )
             
-            logger.info(f"Facebook post completed for meeting: {meeting_id}")
+            logger.info("Facebook post completed for meeting: %s", meeting_id)
             
         except Exception as e:
-            logger.error(f"Error handling Facebook post complete: {str(e)}")
+            logger.error("Error handling Facebook post complete: %s", e)
             raise
 
-    async def _handle_instagram_post_complete(self, meeting_id: str, data: Dict[str, Any]) -> None:
+    def _handle_instagram_post_complete(self, meeting_id: str, data: Dict[str, Any]) -> None:
         """
         Handle Instagram post completion
         
@@ -299,7 +375,7 @@ class WebhookService:
             image_url = data.get('image_url')
             
             # Update blog post with Instagram details
-            await self._update_blog_post_instagram(
+            self._update_blog_post_instagram(
                 blog_id,
                 instagram_post_id,
                 instagram_post_url
@@ -307,10 +383,10 @@ class WebhookService:
             
             # Update poster/image with Instagram posting info if image was used
             if image_url:
-                await self._update_poster_instagram_status(meeting_id, blog_id, image_url)
+                self._update_poster_instagram_status(meeting_id, blog_id, image_url)
             
             # Log processing step
-            await self._log_processing_step(
+            self._log_processing_step(
                 meeting_id,
                 'instagram_post',
                 'completed',
@@ -322,13 +398,13 @@ class WebhookService:
                 }
             )
             
-            logger.info(f"Instagram post completed for meeting: {meeting_id}")
+            logger.info("Instagram post completed for meeting: %s", meeting_id)
             
         except Exception as e:
-            logger.error(f"Error handling Instagram post complete: {str(e)}")
+            logger.error("Error handling Instagram post complete: %s", e)
             raise
     
-    async def _handle_processing_error(self, meeting_id: str, error: str = None) -> None:
+    def _handle_processing_error(self, meeting_id: str, error: str = None) -> None:
         """
         Handle processing errors
         
@@ -338,7 +414,7 @@ class WebhookService:
         """
         try:
             # Log processing step
-            await self._log_processing_step(
+            self._log_processing_step(
                 meeting_id,
                 'error',
                 'failed',
@@ -347,13 +423,13 @@ class WebhookService:
                 }
             )
             
-            logger.error(f"Processing error for meeting {meeting_id}: {error}")
+            logger.error("Processing error for meeting %s: %s", meeting_id, error)
             
         except Exception as e:
-            logger.error(f"Error handling processing error: {str(e)}")
+            logger.error("Error handling processing error: %s", e)
             raise
     
-    async def _update_meeting_transcript(self, meeting_id: str, transcript: str, summary: str) -> Dict[str, Any]:
+    def _update_meeting_transcript(self, meeting_id: str, transcript: str, summary: str) -> Dict[str, Any]:
         """Update meeting with transcript and summary"""
         try:
             update_data = {
@@ -363,30 +439,30 @@ class WebhookService:
             }
             response = self.db_client.table('meetings').update(update_data).eq('id', meeting_id).execute()
             if response.data:
-                logger.info(f"Updated meeting transcript: {meeting_id}")
+                logger.info("Updated meeting transcript: %s", meeting_id)
                 return response.data[0]
             else:
                 raise Exception("Failed to update meeting transcript")
         except Exception as e:
-            logger.error(f"Error updating meeting transcript: {str(e)}")
+            logger.error("Error updating meeting transcript: %s", e)
             raise
     
 
     
-    async def _store_blog_post(self, blog_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _store_blog_post(self, blog_data: Dict[str, Any]) -> Dict[str, Any]:
         """Store generated blog post"""
         try:
             response = self.db_client.table('blog_posts').insert(blog_data).execute()
             if response.data:
-                logger.info(f"Stored blog post: {response.data[0]['id']}")
+                logger.info("Stored blog post: %s", response.data[0]['id'])
                 return response.data[0]
             else:
                 raise Exception("Failed to store blog post")
         except Exception as e:
-            logger.error(f"Error storing blog post: {str(e)}")
+            logger.error("Error storing blog post: %s", e)
             raise
     
-    async def _update_blog_post_facebook(self, blog_id: str, facebook_post_id: str, facebook_post_url: str) -> Dict[str, Any]:
+    def _update_blog_post_facebook(self, blog_id: str, facebook_post_id: str, facebook_post_url: str) -> Dict[str, Any]:
         """Update blog post with Facebook post details"""
         try:
             update_data = {
@@ -395,15 +471,15 @@ class WebhookService:
             }
             response = self.db_client.table('blog_posts').update(update_data).eq('id', blog_id).execute()
             if response.data:
-                logger.info(f"Updated blog post Facebook details: {blog_id}")
+                logger.info("Updated blog post Facebook details: %s", blog_id)
                 return response.data[0]
             else:
                 raise Exception("Failed to update blog post Facebook details")
         except Exception as e:
-            logger.error(f"Error updating blog post Facebook details: {str(e)}")
+            logger.error("Error updating blog post Facebook details: %s", e)
             raise
     
-    async def _update_blog_post_instagram(self, blog_id: str, instagram_post_id: str, instagram_post_url: str) -> Dict[str, Any]:
+    def _update_blog_post_instagram(self, blog_id: str, instagram_post_id: str, instagram_post_url: str) -> Dict[str, Any]:
         """Update blog post with Instagram post details"""
         try:
             update_data = {
@@ -412,50 +488,50 @@ class WebhookService:
             }
             response = self.db_client.table('blog_posts').update(update_data).eq('id', blog_id).execute()
             if response.data:
-                logger.info(f"Updated blog post Instagram details: {blog_id}")
+                logger.info("Updated blog post Instagram details: %s", blog_id)
                 return response.data[0]
             else:
                 raise Exception("Failed to update blog post Instagram details")
         except Exception as e:
-            logger.error(f"Error updating blog post Instagram details: {str(e)}")
+            logger.error("Error updating blog post Instagram details: %s", e)
             raise
     
-    async def _store_generated_image(self, meeting_id: str, blog_id: str, image_url: str, generation_prompt: str = '', image_type: str = 'poster') -> Dict[str, Any]:
+    def _store_generated_image(self, meeting_id: str, blog_id: str, image_url: str, generation_prompt: str = '', image_type: str = 'poster') -> Dict[str, Any]:
         """Store generated image/poster - Note: posters table doesn't exist in current schema"""
         try:
             # Since posters table doesn't exist, we'll just log it
-            logger.info(f"Generated image for meeting {meeting_id}: {image_url}")
+            logger.info("Generated image for meeting %s: %s", meeting_id, image_url)
             return {'status': 'logged', 'image_url': image_url}
         except Exception as e:
-            logger.error(f"Error logging generated image: {str(e)}")
+            logger.error("Error logging generated image: %s", e)
             raise
     
-    async def _update_poster_facebook_status(self, meeting_id: str, blog_id: str, image_url: str) -> Dict[str, Any]:
+    def _update_poster_facebook_status(self, meeting_id: str, blog_id: str, image_url: str) -> Dict[str, Any]:
         """Update poster with Facebook posting status - Note: posters table doesn't exist"""
         try:
             # Since posters table doesn't exist, we'll just log it
-            logger.info(f"Poster Facebook status update for meeting {meeting_id}: {image_url}")
+            logger.info("Poster Facebook status update for meeting %s: %s", meeting_id, image_url)
             return {'status': 'logged'}
         except Exception as e:
-            logger.error(f"Error logging poster Facebook status: {str(e)}")
+            logger.error("Error logging poster Facebook status: %s", e)
             raise
     
-    async def _update_poster_instagram_status(self, meeting_id: str, blog_id: str, image_url: str) -> Dict[str, Any]:
+    def _update_poster_instagram_status(self, meeting_id: str, blog_id: str, image_url: str) -> Dict[str, Any]:
         """Update poster with Instagram posting status - Note: posters table doesn't exist"""
         try:
             # Since posters table doesn't exist, we'll just log it
-            logger.info(f"Poster Instagram status update for meeting {meeting_id}: {image_url}")
+            logger.info("Poster Instagram status update for meeting %s: %s", meeting_id, image_url)
             return {'status': 'logged'}
         except Exception as e:
-            logger.error(f"Error logging poster Instagram status: {str(e)}")
+            logger.error("Error logging poster Instagram status: %s", e)
             raise
     
-    async def _log_processing_step(self, meeting_id: str, step: str, status: str, details: Dict[str, Any] = None) -> Dict[str, Any]:
+    def _log_processing_step(self, meeting_id: str, step: str, status: str, details: Dict[str, Any] = None) -> Dict[str, Any]:
         """Log a processing step - Note: processing_logs table doesn't exist in current schema"""
         try:
             # Since processing_logs table doesn't exist, we'll just log it
-            logger.info(f"Processing step: {meeting_id} - {step} - {status} - {details}")
+            logger.info("Processing step: %s - %s - %s - %s", meeting_id, step, status, details)
             return {'status': 'logged'}
         except Exception as e:
-            logger.error(f"Error logging processing step: {str(e)}")
+            logger.error("Error logging processing step: %s", e)
             raise 
\ No newline at end of file
@@ -0,0 +1,14 @@
+"""
+WSGI entry point for Blog Automation System
+
+Production servers import `application` from this module, e.g.:
+
+    gunicorn -c gunicorn.conf.py wsgi:application
+
+Author: Your Name
+Date: 2024
+"""
+
+from main import create_app
+
+application = create_app()
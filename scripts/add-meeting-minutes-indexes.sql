@@ -0,0 +1,27 @@
+-- Foreign key and index backing the meetings-with-transcripts queries
+-- Run this in your Supabase SQL Editor
+
+-- PostgREST needs this relationship to embed meeting_minutes under meetings
+-- (select=...,meeting_minutes!inner(...)).
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1
+        FROM pg_constraint
+        WHERE conrelid = 'public.meeting_minutes'::regclass
+          AND contype = 'f'
+          AND confrelid = 'public.meetings'::regclass
+    ) THEN
+        ALTER TABLE public.meeting_minutes
+        ADD CONSTRAINT meeting_minutes_meeting_id_fkey
+        FOREIGN KEY (meeting_id) REFERENCES public.meetings(id) ON DELETE CASCADE;
+    END IF;
+END $$;
+
+-- Only minutes with a usable transcript take part in the join
+CREATE INDEX IF NOT EXISTS idx_meeting_minutes_meeting_id_with_transcript
+ON public.meeting_minutes(meeting_id, created_at DESC)
+WHERE transcript IS NOT NULL AND transcript <> '';
+
+-- Refresh PostgREST's schema cache so the new relationship is visible
+NOTIFY pgrst, 'reload schema';
@@ -0,0 +1,8 @@
+-- Indexes backing the meetings list pagination
+-- Run this in your Supabase SQL Editor
+
+-- Keyset (cursor) pagination on GET /api/meetings: filters by organization and
+-- seeks on (created_at, id) descending, so each page is a short index range scan
+-- no matter how deep the client has paged.
+CREATE INDEX IF NOT EXISTS idx_meetings_org_created_at_id
+ON public.meetings(organization_id, created_at DESC, id DESC);
@@ -0,0 +1,20 @@
+-- Link local meetings to the Supabase meeting they were created from
+-- Run this in your Supabase SQL Editor before deploying the backend that upserts meetings
+
+-- Source meeting ID (NULL for meetings uploaded directly)
+ALTER TABLE public.meetings
+ADD COLUMN IF NOT EXISTS supabase_meeting_id UUID;
+
+-- One local meeting per Supabase meeting and organization.
+-- Must be a plain (non-partial) unique index so it can be used as the
+-- ON CONFLICT target of the backend's upsert; NULLs never conflict.
+CREATE UNIQUE INDEX IF NOT EXISTS idx_meetings_org_supabase_meeting_id
+ON public.meetings(organization_id, supabase_meeting_id);
+
+-- The backend no longer sends created_at, so make sure the column has a default
+ALTER TABLE public.meetings
+ALTER COLUMN created_at SET DEFAULT now();
+
+-- Note: meetings processed before this migration have no supabase_meeting_id.
+-- Processing such a meeting again creates a new linked row instead of
+-- updating the old one (previously matched by title).
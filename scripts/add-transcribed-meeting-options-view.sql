@@ -0,0 +1,99 @@
+-- Precomputed dropdown options for meetings that have a transcript
+-- Run this in your Supabase SQL Editor, then set
+-- TRANSCRIBED_OPTIONS_VIEW_ENABLED=true for the backend
+--
+-- Writes only mark the view dirty; a pg_cron job refreshes it at most once a
+-- minute, so new transcripts can take up to a minute to appear in the dropdown.
+-- Requires the pg_cron extension (Database -> Extensions in Supabase).
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS public.transcribed_meeting_options AS
+SELECT
+    m.id AS value,
+    COALESCE(NULLIF(m.title, ''), 'Meeting ' || substr(m.id::text, 1, 8)) AS label,
+    m.organization_id,
+    m.created_at
+FROM public.meetings m
+WHERE EXISTS (
+    SELECT 1
+    FROM public.meeting_minutes mm
+    WHERE mm.meeting_id = m.id
+      AND mm.transcript IS NOT NULL
+      AND mm.transcript <> ''
+);
+
+-- Required by REFRESH ... CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_transcribed_meeting_options_value
+ON public.transcribed_meeting_options(value);
+
+-- Serves the organization filter and newest-first ordering
+CREATE INDEX IF NOT EXISTS idx_transcribed_meeting_options_org_created_at
+ON public.transcribed_meeting_options(organization_id, created_at DESC);
+
+GRANT SELECT ON public.transcribed_meeting_options TO anon, authenticated, service_role;
+
+-- Single-row dirty flag set by writes and cleared by the scheduled refresh
+CREATE TABLE IF NOT EXISTS public.transcribed_meeting_options_state (
+    id boolean PRIMARY KEY DEFAULT true CHECK (id),
+    dirty boolean NOT NULL DEFAULT false
+);
+INSERT INTO public.transcribed_meeting_options_state (id, dirty)
+VALUES (true, false)
+ON CONFLICT (id) DO NOTHING;
+ALTER TABLE public.transcribed_meeting_options_state ENABLE ROW LEVEL SECURITY;
+
+CREATE OR REPLACE FUNCTION public.mark_transcribed_meeting_options_dirty()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    -- Skip the write when already dirty so bursts don't churn the row
+    UPDATE public.transcribed_meeting_options_state SET dirty = true WHERE NOT dirty;
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.refresh_transcribed_meeting_options_if_dirty()
+RETURNS void
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    -- Clearing the flag in this transaction holds its row lock until commit, so
+    -- writes made during the refresh set it again for the next run
+    UPDATE public.transcribed_meeting_options_state SET dirty = false WHERE dirty;
+    IF FOUND THEN
+        REFRESH MATERIALIZED VIEW CONCURRENTLY public.transcribed_meeting_options;
+    END IF;
+END;
+$$;
+
+-- Not callable through the API (PostgREST exposes functions as RPCs)
+REVOKE EXECUTE ON FUNCTION public.mark_transcribed_meeting_options_dirty() FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION public.refresh_transcribed_meeting_options_if_dirty() FROM PUBLIC, anon, authenticated;
+
+DROP TRIGGER IF EXISTS trg_transcribed_options_dirty_minutes ON public.meeting_minutes;
+CREATE TRIGGER trg_transcribed_options_dirty_minutes
+AFTER INSERT OR UPDATE OF transcript, meeting_id OR DELETE ON public.meeting_minutes
+FOR EACH STATEMENT EXECUTE FUNCTION public.mark_transcribed_meeting_options_dirty();
+
+DROP TRIGGER IF EXISTS trg_transcribed_options_dirty_meetings ON public.meetings;
+CREATE TRIGGER trg_transcribed_options_dirty_meetings
+AFTER UPDATE OF title, organization_id OR DELETE ON public.meetings
+FOR EACH STATEMENT EXECUTE FUNCTION public.mark_transcribed_meeting_options_dirty();
+
+-- Refresh once a minute when something changed
+CREATE EXTENSION IF NOT EXISTS pg_cron;
+SELECT cron.schedule(
+    'refresh-transcribed-meeting-options',
+    '* * * * *',
+    $$SELECT public.refresh_transcribed_meeting_options_if_dirty()$$
+);
+
+-- Populate it now
+REFRESH MATERIALIZED VIEW public.transcribed_meeting_options;
+
+-- Refresh PostgREST's schema cache so the view is visible
+NOTIFY pgrst, 'reload schema';